@@ -5,12 +5,16 @@ Configuration Validator Module
 Validates migration configuration files against schema and best practices.
 """
 
+import functools
 import json
 import re
 from pathlib import Path
 from typing import Dict, List, Tuple
 
-from jsonschema import ValidationError, validate
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+from .json_loader import load_file
 
 try:
     from .migration_models import MigrationConfig, TableConfig
@@ -24,6 +28,32 @@ except ImportError:
         TableConfig = None
 
 
+@functools.lru_cache(maxsize=4)
+def _load_schema_cached(path: str, mtime_ns: int) -> Dict:
+    """
+    Read and parse a JSON schema (cached on path + mtime)
+
+    Every ConfigValidator instance shares the parsed schema, so creating
+    one per validation does not re-read the file. The schema is only
+    read, never modified.
+    """
+    return load_file(path)
+
+
+@functools.lru_cache(maxsize=4)
+def _schema_validator(path: str, mtime_ns: int):
+    """
+    Build a jsonschema validator for a schema file (cached like the schema)
+
+    jsonschema.validate() checks the schema and builds a new validator on
+    every call; this does both once per schema file.
+    """
+    schema = _load_schema_cached(path, mtime_ns)
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
 class ConfigValidator:
     """Validates migration configuration files"""
 
@@ -50,8 +80,11 @@ class ConfigValidator:
                 raise FileNotFoundError(f"Schema file not found: {self.schema_file}")
             self.schema_file = schema_path
 
-        with open(self.schema_file) as f:
-            return json.load(f)
+        self._schema_key = (
+            str(self.schema_file.resolve()),
+            self.schema_file.stat().st_mtime_ns,
+        )
+        return _load_schema_cached(*self._schema_key)
 
     def validate_config(
         self, config: Dict, check_database: bool = False
@@ -115,9 +148,10 @@ class ConfigValidator:
 
     def _validate_schema(self, config: Dict):
         """Validate against JSON schema"""
-        try:
-            validate(instance=config, schema=self.schema)
-        except ValidationError as e:
+        # Same error selection as jsonschema.validate(), on the cached validator
+        validator = _schema_validator(*self._schema_key)
+        e = best_match(validator.iter_errors(config))
+        if e is not None:
             self.errors.append(f"JSON Schema Validation: {e.message}")
             # Add path info for nested errors
             if e.path:
@@ -455,8 +489,7 @@ class ConfigValidator:
             return False
 
         try:
-            with open(config_path) as f:
-                config = json.load(f)
+            config = load_file(config_path)
         except json.JSONDecodeError as e:
             print(f"ERROR: Invalid JSON in {config_file}")
             print(f"  {e}")
@@ -75,8 +75,7 @@ class EnvironmentConfigManager:
             # Fallback to default config
             return self._create_default_config(environment)
 
-        with open(self.config_file, "r") as f:
-            config_data = json.load(f)
+        config_data = json.loads(self.config_file.read_bytes())
 
         # Get environment config from consolidated file
         env_config = config_data.get("environments", {}).get(environment, {})
@@ -294,8 +293,7 @@ class EnvironmentConfigManager:
 
         # Load existing config or create new one
         if self.config_file.exists():
-            with open(self.config_file, "r") as f:
-                existing_config = json.load(f)
+            existing_config = json.loads(self.config_file.read_bytes())
         else:
             existing_config = {"environments": {}, "additional_configs": {}}
 
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+JSON Loader Module
+==================
+Parses JSON documents with orjson when it is installed, otherwise with the
+standard library.
+
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+json.JSONDecodeError whichever parser is used.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document
+
+    Args:
+        data: Raw bytes (UTF-8/16/32) or text
+
+    Returns:
+        Parsed document
+    """
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """
+    Read a JSON file in one call and parse it
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed document
+    """
+    return loads(Path(path).read_bytes())
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
+# schema-sha256: 7fe63d8daa281d8d15e0172d650d227800b3ce7f09931cbc925827869f1ac21f
 """
 Generated Migration Models
 =========================
 Auto-generated from enhanced_migration_schema.json
 DO NOT EDIT MANUALLY - Run: python3 src/schema_to_dataclass.py
 
-Generated: 2025-10-27 09:20:20
+Generated: 2026-10-16 23:06:09
 """
 
 from __future__ import annotations
@@ -13,6 +14,25 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Dict, Any
+import dataclasses
+import sys
+
+# Slotted dataclasses (no per-instance __dict__) on Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+def _convert(val):
+    """Recursively convert enums and nested dataclasses for JSON"""
+    if isinstance(val, Enum):
+        return val.value
+    elif dataclasses.is_dataclass(val):
+        return val.to_dict()
+    elif isinstance(val, list):
+        return [_convert(v) for v in val]
+    elif isinstance(val, dict):
+        return {k: _convert(v) for k, v in val.items()}
+    else:
+        return val
+
 
 class PartitionTypeEnum(Enum):
     """PartitionTypeEnum enumeration"""
@@ -109,62 +129,142 @@ class LocalityEnum(Enum):
     LOCAL = "LOCAL"
     GLOBAL = "GLOBAL"
 
-@dataclass
-class IndexInfo:
-    """Oracle index definition with storage details"""
-    index_name: str  # Index name
-    index_type: str  # Oracle index type
-    columns: str  # Comma-separated list of index columns
-    uniqueness: str = None  # Index uniqueness
-    tablespace_name: str = None  # Index tablespace
-    compression: str = None  # Index compression
-    pct_free: int = None  # Index PCTFREE
-    ini_trans: int = None  # Index INITRANS
-    max_trans: int = None  # Index MAXTRANS
-    degree: str = None  # Parallel degree for index operations
-    partitioned: YesNoEnum = None
-    is_reverse: bool = None  # Whether index is reverse key
-    locality: Optional[str] = None  # Partitioned index locality
+@dataclass(**_DATACLASS_OPTIONS)
+class ConnectionDetails:
+    """Database connection details for metadata tracking"""
+    type: str = None  # Oracle connection type
+    host: str = None  # Database host
+    port: str = None  # Database port
+    service: str = None  # Oracle service name or SID
+    user: str = None  # Database user
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "type": self.type,
+            "host": self.host,
+            "port": self.port,
+            "service": self.service,
+            "user": self.user,
+        }
+
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "IndexInfo":
+    def from_dict(cls, data: Dict[str, Any]) -> "ConnectionDetails":
         """Create instance from dictionary with proper type conversions"""
         if data is None:
             return None
         return cls(
-            index_name=data["index_name"],
-            index_type=data["index_type"],
-            uniqueness=data.get("uniqueness"),
-            tablespace_name=data.get("tablespace_name"),
-            compression=data.get("compression"),
-            pct_free=data.get("pct_free"),
-            ini_trans=data.get("ini_trans"),
-            max_trans=data.get("max_trans"),
-            degree=data.get("degree"),
-            partitioned=YesNoEnum(data["partitioned"]) if "partitioned" in data and data["partitioned"] is not None else None,
-            columns=data["columns"],
-            is_reverse=data.get("is_reverse", False),
-            locality=data.get("locality"),
+            type=data.get("type"),
+            host=data.get("host"),
+            port=data.get("port"),
+            service=data.get("service"),
+            user=data.get("user"),
+        )
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class TablespaceConfig:
+    """Tablespace names for data and LOB storage"""
+    primary: str = None  # Primary tablespace for table data
+    lob: List[str] = field(default_factory=list)  # Array of LOB tablespaces
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "primary": self.primary,
+            "lob": _convert(self.lob),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TablespaceConfig":
+        """Create instance from dictionary with proper type conversions"""
+        if data is None:
+            return None
+        return cls(
+            primary=data.get("primary"),
+            lob=data.get("lob", []),
+        )
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class SubpartitionDefaults:
+    """Default settings for subpartitioning"""
+    min_count: int = None  # Minimum subpartition count
+    max_count: int = None  # Maximum subpartition count
+    size_based_recommendations: Dict[str, Any] = field(default_factory=dict)  # Size-based subpartition recommendations
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "min_count": self.min_count,
+            "max_count": self.max_count,
+            "size_based_recommendations": _convert(self.size_based_recommendations),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SubpartitionDefaults":
+        """Create instance from dictionary with proper type conversions"""
+        if data is None:
+            return None
+        return cls(
+            min_count=data.get("min_count"),
+            max_count=data.get("max_count"),
+            size_based_recommendations=data.get("size_based_recommendations"),
+        )
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class ParallelDefaults:
+    """Default parallel execution settings"""
+    min_degree: int = None  # Minimum parallel degree
+    max_degree: int = None  # Maximum parallel degree
+    default_degree: int = None  # Default parallel degree
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "min_degree": self.min_degree,
+            "max_degree": self.max_degree,
+            "default_degree": self.default_degree,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ParallelDefaults":
+        """Create instance from dictionary with proper type conversions"""
+        if data is None:
+            return None
+        return cls(
+            min_degree=data.get("min_degree"),
+            max_degree=data.get("max_degree"),
+            default_degree=data.get("default_degree"),
+        )
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class SizeRecommendation:
+    """Size-based partitioning recommendation"""
+    max_gb: float  # Maximum size in GB for this recommendation
+    count: int  # Recommended partition count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "max_gb": self.max_gb,
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SizeRecommendation":
+        """Create instance from dictionary with proper type conversions"""
+        if data is None:
+            return None
+        return cls(
+            max_gb=data["max_gb"],
+            count=data["count"],
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ColumnInfo:
     """Complete column metadata for Oracle DDL generation"""
     name: str  # Column name
@@ -187,21 +287,27 @@ class ColumnInfo:
     identity_order_flag: Optional[str] = None  # Identity ORDER flag
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        # Remove identity-specific fields if this is not an identity column
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        result = {
+            "name": self.name,
+            "type": self.type,
+            "nullable": _convert(self.nullable),
+            "length": self.length,
+            "precision": self.precision,
+            "scale": self.scale,
+            "default": self.default,
+            "char_length": self.char_length,
+            "is_identity": self.is_identity,
+            "identity_generation": self.identity_generation,
+            "identity_sequence": self.identity_sequence,
+            "identity_start_with": self.identity_start_with,
+            "identity_increment_by": self.identity_increment_by,
+            "identity_max_value": self.identity_max_value,
+            "identity_min_value": self.identity_min_value,
+            "identity_cache_size": self.identity_cache_size,
+            "identity_cycle_flag": self.identity_cycle_flag,
+            "identity_order_flag": self.identity_order_flag,
+        }
         if hasattr(self, 'is_identity') and not self.is_identity:
             identity_fields = [
                 'identity_generation', 'identity_sequence', 'identity_start_with',
@@ -211,6 +317,7 @@ class ColumnInfo:
             for field in identity_fields:
                 result.pop(field, None)
         return result
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ColumnInfo":
         """Create instance from dictionary with proper type conversions"""
@@ -238,42 +345,55 @@ class ColumnInfo:
         )
 
 
-@dataclass
-class AvailableColumns:
-    """Columns available for different partitioning strategies"""
-    timestamp_columns: List[ColumnInfo] = field(default_factory=list)  # Timestamp/date columns suitable for interval partitioning
-    numeric_columns: List[ColumnInfo] = field(default_factory=list)  # Numeric columns suitable for hash/range partitioning
-    string_columns: List[ColumnInfo] = field(default_factory=list)  # String columns suitable for hash/list partitioning
+@dataclass(**_DATACLASS_OPTIONS)
+class LobStorageInfo:
+    """LOB storage configuration for Oracle DDL"""
+    column_name: str  # LOB column name
+    tablespace_name: str  # LOB tablespace
+    segment_name: str = None  # LOB segment name
+    original_tablespace: str = None  # Original LOB tablespace
+    securefile: YesNoEnum = None
+    compression: YesNoEnum = None
+    deduplication: YesNoEnum = None
+    in_row: YesNoEnum = None
+    chunk: int = None  # LOB chunk size
+    cache: YesNoEnum = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "column_name": self.column_name,
+            "tablespace_name": self.tablespace_name,
+            "segment_name": self.segment_name,
+            "original_tablespace": self.original_tablespace,
+            "securefile": _convert(self.securefile),
+            "compression": _convert(self.compression),
+            "deduplication": _convert(self.deduplication),
+            "in_row": _convert(self.in_row),
+            "chunk": self.chunk,
+            "cache": _convert(self.cache),
+        }
+
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "AvailableColumns":
+    def from_dict(cls, data: Dict[str, Any]) -> "LobStorageInfo":
         """Create instance from dictionary with proper type conversions"""
         if data is None:
             return None
         return cls(
-            timestamp_columns=[ColumnInfo.from_dict(x) for x in data.get("timestamp_columns", [])],
-            numeric_columns=[ColumnInfo.from_dict(x) for x in data.get("numeric_columns", [])],
-            string_columns=[ColumnInfo.from_dict(x) for x in data.get("string_columns", [])],
+            column_name=data["column_name"],
+            segment_name=data.get("segment_name"),
+            tablespace_name=data["tablespace_name"],
+            original_tablespace=data.get("original_tablespace"),
+            securefile=YesNoEnum(data["securefile"]) if "securefile" in data and data["securefile"] is not None else None,
+            compression=YesNoEnum(data["compression"]) if "compression" in data and data["compression"] is not None else None,
+            deduplication=YesNoEnum(data["deduplication"]) if "deduplication" in data and data["deduplication"] is not None else None,
+            in_row=YesNoEnum(data["in_row"]) if "in_row" in data and data["in_row"] is not None else None,
+            chunk=data.get("chunk"),
+            cache=YesNoEnum(data["cache"]) if "cache" in data and data["cache"] is not None else None,
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class StorageParameters:
     """Oracle table storage parameters"""
     compression: str = None  # Table compression setting
@@ -286,21 +406,18 @@ class StorageParameters:
     buffer_pool: str = None  # Buffer pool assignment
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "compression": self.compression,
+            "compress_for": self.compress_for,
+            "pct_free": self.pct_free,
+            "ini_trans": self.ini_trans,
+            "max_trans": self.max_trans,
+            "initial_extent": self.initial_extent,
+            "next_extent": self.next_extent,
+            "buffer_pool": self.buffer_pool,
+        }
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "StorageParameters":
         """Create instance from dictionary with proper type conversions"""
@@ -318,123 +435,97 @@ class StorageParameters:
         )
 
 
-@dataclass
-class LobStorageInfo:
-    """LOB storage configuration for Oracle DDL"""
-    column_name: str  # LOB column name
-    tablespace_name: str  # LOB tablespace
-    segment_name: str = None  # LOB segment name
-    original_tablespace: str = None  # Original LOB tablespace
-    securefile: YesNoEnum = None
-    compression: YesNoEnum = None
-    deduplication: YesNoEnum = None
-    in_row: YesNoEnum = None
-    chunk: int = None  # LOB chunk size
-    cache: YesNoEnum = None
+@dataclass(**_DATACLASS_OPTIONS)
+class IndexInfo:
+    """Oracle index definition with storage details"""
+    index_name: str  # Index name
+    index_type: str  # Oracle index type
+    columns: str  # Comma-separated list of index columns
+    uniqueness: str = None  # Index uniqueness
+    tablespace_name: str = None  # Index tablespace
+    compression: str = None  # Index compression
+    pct_free: int = None  # Index PCTFREE
+    ini_trans: int = None  # Index INITRANS
+    max_trans: int = None  # Index MAXTRANS
+    degree: str = None  # Parallel degree for index operations
+    partitioned: YesNoEnum = None
+    is_reverse: bool = None  # Whether index is reverse key
+    locality: Optional[str] = None  # Partitioned index locality
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "index_name": self.index_name,
+            "index_type": self.index_type,
+            "columns": self.columns,
+            "uniqueness": self.uniqueness,
+            "tablespace_name": self.tablespace_name,
+            "compression": self.compression,
+            "pct_free": self.pct_free,
+            "ini_trans": self.ini_trans,
+            "max_trans": self.max_trans,
+            "degree": self.degree,
+            "partitioned": _convert(self.partitioned),
+            "is_reverse": self.is_reverse,
+            "locality": self.locality,
+        }
+
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "LobStorageInfo":
+    def from_dict(cls, data: Dict[str, Any]) -> "IndexInfo":
         """Create instance from dictionary with proper type conversions"""
         if data is None:
             return None
         return cls(
-            column_name=data["column_name"],
-            segment_name=data.get("segment_name"),
-            tablespace_name=data["tablespace_name"],
-            original_tablespace=data.get("original_tablespace"),
-            securefile=YesNoEnum(data["securefile"]) if "securefile" in data and data["securefile"] is not None else None,
-            compression=YesNoEnum(data["compression"]) if "compression" in data and data["compression"] is not None else None,
-            deduplication=YesNoEnum(data["deduplication"]) if "deduplication" in data and data["deduplication"] is not None else None,
-            in_row=YesNoEnum(data["in_row"]) if "in_row" in data and data["in_row"] is not None else None,
-            chunk=data.get("chunk"),
-            cache=YesNoEnum(data["cache"]) if "cache" in data and data["cache"] is not None else None,
+            index_name=data["index_name"],
+            index_type=data["index_type"],
+            uniqueness=data.get("uniqueness"),
+            tablespace_name=data.get("tablespace_name"),
+            compression=data.get("compression"),
+            pct_free=data.get("pct_free"),
+            ini_trans=data.get("ini_trans"),
+            max_trans=data.get("max_trans"),
+            degree=data.get("degree"),
+            partitioned=YesNoEnum(data["partitioned"]) if "partitioned" in data and data["partitioned"] is not None else None,
+            columns=data["columns"],
+            is_reverse=data.get("is_reverse", False),
+            locality=data.get("locality"),
         )
 
 
-@dataclass
-class CurrentState:
-    """Complete current table state with all Oracle metadata"""
-    is_partitioned: bool  # Whether table is currently partitioned
-    partition_type: PartitionTypeEnum
-    size_gb: float  # Table size in GB
-    row_count: int  # Approximate row count
-    lob_count: int  # Number of LOB columns
-    index_count: int  # Number of indexes
-    columns: List[ColumnInfo]  # Complete column metadata for DDL generation
-    lob_storage: List[LobStorageInfo]  # LOB storage configuration details
-    storage_parameters: StorageParameters
-    indexes: List[IndexInfo]  # Index definitions with columns and storage
-    available_columns: AvailableColumns
-    is_interval: bool = None  # Whether table uses interval partitioning
-    interval_definition: str = None  # Current interval definition if applicable
-    current_partition_count: int = None  # Current number of partitions
-    current_partition_key: str = None  # Current partition key column(s)
-    has_subpartitions: bool = None  # Whether table has subpartitions
-    subpartition_type: str = None  # Current subpartition type if applicable
-    subpartition_count: int = None  # Current number of subpartitions per partition
-    grants: List[Dict[str, Any]] = field(default_factory=list)  # Table grants and privileges for DDL generation
+@dataclass(**_DATACLASS_OPTIONS)
+class PartitionStorageSettings:
+    """Storage parameters for interval-hash partitioned tables"""
+    data_tablespace: str = None  # Primary data tablespace for partitions
+    subpartition_tablespaces: List[str] = field(default_factory=list)  # Array of tablespaces to distribute hash subpartitions across
+    pct_free: int = None  # PCTFREE for partitions
+    compression: str = None  # Partition-level compression
+    segment_attributes: Dict[str, Any] = field(default_factory=dict)  # Additional segment attributes for partitions
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "data_tablespace": self.data_tablespace,
+            "subpartition_tablespaces": _convert(self.subpartition_tablespaces),
+            "pct_free": self.pct_free,
+            "compression": self.compression,
+            "segment_attributes": _convert(self.segment_attributes),
+        }
+
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "CurrentState":
+    def from_dict(cls, data: Dict[str, Any]) -> "PartitionStorageSettings":
         """Create instance from dictionary with proper type conversions"""
         if data is None:
             return None
         return cls(
-            is_partitioned=data.get("is_partitioned", False),
-            partition_type=PartitionTypeEnum(data["partition_type"]) if "partition_type" in data else None,
-            size_gb=data["size_gb"],
-            row_count=data["row_count"],
-            lob_count=data["lob_count"],
-            index_count=data["index_count"],
-            columns=[ColumnInfo.from_dict(x) for x in data.get("columns", [])],
-            lob_storage=[LobStorageInfo.from_dict(x) for x in data.get("lob_storage", [])],
-            storage_parameters=StorageParameters.from_dict(data["storage_parameters"]) if "storage_parameters" in data else None,
-            indexes=[IndexInfo.from_dict(x) for x in data.get("indexes", [])],
-            available_columns=AvailableColumns.from_dict(data["available_columns"]) if "available_columns" in data else None,
-            is_interval=data.get("is_interval", False),
-            interval_definition=data.get("interval_definition"),
-            current_partition_count=data.get("current_partition_count"),
-            current_partition_key=data.get("current_partition_key"),
-            has_subpartitions=data.get("has_subpartitions", False),
-            subpartition_type=data.get("subpartition_type"),
-            subpartition_count=data.get("subpartition_count"),
-            grants=data.get("grants", []),
+            data_tablespace=data.get("data_tablespace", "USERS"),
+            subpartition_tablespaces=data.get("subpartition_tablespaces", []),
+            pct_free=data.get("pct_free", 10),
+            compression=data.get("compression", "DISABLED"),
+            segment_attributes=data.get("segment_attributes"),
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MigrationSettings:
     """Migration execution and validation settings"""
     validate_data: bool = None  # Whether to validate data after migration
@@ -442,21 +533,13 @@ class MigrationSettings:
     drop_old_after_days: int = None  # Days to wait before dropping old table (0 = immediate)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "validate_data": self.validate_data,
+            "backup_old_table": self.backup_old_table,
+            "drop_old_after_days": self.drop_old_after_days,
+        }
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MigrationSettings":
         """Create instance from dictionary with proper type conversions"""
@@ -469,46 +552,100 @@ class MigrationSettings:
         )
 
 
-@dataclass
-class PartitionStorageSettings:
-    """Storage parameters for interval-hash partitioned tables"""
-    data_tablespace: str = None  # Primary data tablespace for partitions
-    subpartition_tablespaces: List[str] = field(default_factory=list)  # Array of tablespaces to distribute hash subpartitions across
-    pct_free: int = None  # PCTFREE for partitions
-    compression: str = None  # Partition-level compression
-    segment_attributes: Dict[str, Any] = field(default_factory=dict)  # Additional segment attributes for partitions
+@dataclass(**_DATACLASS_OPTIONS)
+class Metadata:
+    """Metadata about the migration configuration"""
+    generated_date: str  # Date and time when configuration was generated
+    source_schema: str  # Oracle schema name being analyzed
+    environment: str = None  # Environment name (dev, test, prod)
+    source_database_service: str = None  # Oracle database service name
+    source_connection_details: ConnectionDetails = None
+    discovery_criteria: str = None  # Criteria used for table discovery
+    total_tables_found: int = None  # Total number of tables discovered
+    tables_selected_for_migration: int = None  # Number of tables enabled for migration
+    schema: str = None  # Alias for source_schema for backward compatibility
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "generated_date": self.generated_date,
+            "source_schema": self.source_schema,
+            "environment": self.environment,
+            "source_database_service": self.source_database_service,
+            "source_connection_details": _convert(self.source_connection_details),
+            "discovery_criteria": self.discovery_criteria,
+            "total_tables_found": self.total_tables_found,
+            "tables_selected_for_migration": self.tables_selected_for_migration,
+            "schema": self.schema,
+        }
+
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "PartitionStorageSettings":
+    def from_dict(cls, data: Dict[str, Any]) -> "Metadata":
         """Create instance from dictionary with proper type conversions"""
         if data is None:
             return None
         return cls(
-            data_tablespace=data.get("data_tablespace", "USERS"),
-            subpartition_tablespaces=data.get("subpartition_tablespaces", []),
-            pct_free=data.get("pct_free", 10),
-            compression=data.get("compression", "DISABLED"),
-            segment_attributes=data.get("segment_attributes"),
+            generated_date=data["generated_date"],
+            environment=data.get("environment", "global"),
+            source_schema=data["source_schema"],
+            source_database_service=data.get("source_database_service"),
+            source_connection_details=ConnectionDetails.from_dict(data["source_connection_details"]) if "source_connection_details" in data and data["source_connection_details"] is not None else None,
+            discovery_criteria=data.get("discovery_criteria"),
+            total_tables_found=data.get("total_tables_found"),
+            tables_selected_for_migration=data.get("tables_selected_for_migration"),
+            schema=data.get("schema"),
+        )
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class DataTablespaces:
+    """Tablespace configuration for data and LOB storage"""
+    data: TablespaceConfig = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "data": _convert(self.data),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DataTablespaces":
+        """Create instance from dictionary with proper type conversions"""
+        if data is None:
+            return None
+        return cls(
+            data=TablespaceConfig.from_dict(data["data"]) if "data" in data and data["data"] is not None else None,
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
+class AvailableColumns:
+    """Columns available for different partitioning strategies"""
+    timestamp_columns: List[ColumnInfo] = field(default_factory=list)  # Timestamp/date columns suitable for interval partitioning
+    numeric_columns: List[ColumnInfo] = field(default_factory=list)  # Numeric columns suitable for hash/range partitioning
+    string_columns: List[ColumnInfo] = field(default_factory=list)  # String columns suitable for hash/list partitioning
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "timestamp_columns": _convert(self.timestamp_columns),
+            "numeric_columns": _convert(self.numeric_columns),
+            "string_columns": _convert(self.string_columns),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AvailableColumns":
+        """Create instance from dictionary with proper type conversions"""
+        if data is None:
+            return None
+        return cls(
+            timestamp_columns=[ColumnInfo.from_dict(x) for x in data.get("timestamp_columns", [])],
+            numeric_columns=[ColumnInfo.from_dict(x) for x in data.get("numeric_columns", [])],
+            string_columns=[ColumnInfo.from_dict(x) for x in data.get("string_columns", [])],
+        )
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class TargetConfiguration:
     """Target partitioning configuration for Oracle tables"""
     partition_type: PartitionTypeEnum
@@ -525,21 +662,22 @@ class TargetConfiguration:
     partition_storage: PartitionStorageSettings = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "partition_type": _convert(self.partition_type),
+            "partition_column": self.partition_column,
+            "interval_type": _convert(self.interval_type),
+            "interval_value": self.interval_value,
+            "initial_partition_value": self.initial_partition_value,
+            "subpartition_type": _convert(self.subpartition_type),
+            "subpartition_column": self.subpartition_column,
+            "subpartition_count": self.subpartition_count,
+            "tablespace": self.tablespace,
+            "lob_tablespaces": _convert(self.lob_tablespaces),
+            "parallel_degree": self.parallel_degree,
+            "partition_storage": _convert(self.partition_storage),
+        }
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TargetConfiguration":
         """Create instance from dictionary with proper type conversions"""
@@ -561,7 +699,112 @@ class TargetConfiguration:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
+class EnvironmentConfig:
+    """Environment-specific configuration for tablespaces and defaults"""
+    name: str  # Environment name
+    tablespaces: DataTablespaces
+    subpartition_defaults: SubpartitionDefaults = None
+    parallel_defaults: ParallelDefaults = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "name": self.name,
+            "tablespaces": _convert(self.tablespaces),
+            "subpartition_defaults": _convert(self.subpartition_defaults),
+            "parallel_defaults": _convert(self.parallel_defaults),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EnvironmentConfig":
+        """Create instance from dictionary with proper type conversions"""
+        if data is None:
+            return None
+        return cls(
+            name=data["name"],
+            tablespaces=DataTablespaces.from_dict(data["tablespaces"]) if "tablespaces" in data else None,
+            subpartition_defaults=SubpartitionDefaults.from_dict(data["subpartition_defaults"]) if "subpartition_defaults" in data and data["subpartition_defaults"] is not None else None,
+            parallel_defaults=ParallelDefaults.from_dict(data["parallel_defaults"]) if "parallel_defaults" in data and data["parallel_defaults"] is not None else None,
+        )
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class CurrentState:
+    """Complete current table state with all Oracle metadata"""
+    is_partitioned: bool  # Whether table is currently partitioned
+    partition_type: PartitionTypeEnum
+    size_gb: float  # Table size in GB
+    row_count: int  # Approximate row count
+    lob_count: int  # Number of LOB columns
+    index_count: int  # Number of indexes
+    columns: List[ColumnInfo]  # Complete column metadata for DDL generation
+    lob_storage: List[LobStorageInfo]  # LOB storage configuration details
+    storage_parameters: StorageParameters
+    indexes: List[IndexInfo]  # Index definitions with columns and storage
+    available_columns: AvailableColumns
+    is_interval: bool = None  # Whether table uses interval partitioning
+    interval_definition: str = None  # Current interval definition if applicable
+    current_partition_count: int = None  # Current number of partitions
+    current_partition_key: str = None  # Current partition key column(s)
+    has_subpartitions: bool = None  # Whether table has subpartitions
+    subpartition_type: str = None  # Current subpartition type if applicable
+    subpartition_count: int = None  # Current number of subpartitions per partition
+    grants: List[Dict[str, Any]] = field(default_factory=list)  # Table grants and privileges for DDL generation
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "is_partitioned": self.is_partitioned,
+            "partition_type": _convert(self.partition_type),
+            "size_gb": self.size_gb,
+            "row_count": self.row_count,
+            "lob_count": self.lob_count,
+            "index_count": self.index_count,
+            "columns": _convert(self.columns),
+            "lob_storage": _convert(self.lob_storage),
+            "storage_parameters": _convert(self.storage_parameters),
+            "indexes": _convert(self.indexes),
+            "available_columns": _convert(self.available_columns),
+            "is_interval": self.is_interval,
+            "interval_definition": self.interval_definition,
+            "current_partition_count": self.current_partition_count,
+            "current_partition_key": self.current_partition_key,
+            "has_subpartitions": self.has_subpartitions,
+            "subpartition_type": self.subpartition_type,
+            "subpartition_count": self.subpartition_count,
+            "grants": _convert(self.grants),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CurrentState":
+        """Create instance from dictionary with proper type conversions"""
+        if data is None:
+            return None
+        return cls(
+            is_partitioned=data.get("is_partitioned", False),
+            partition_type=PartitionTypeEnum(data["partition_type"]) if "partition_type" in data else None,
+            size_gb=data["size_gb"],
+            row_count=data["row_count"],
+            lob_count=data["lob_count"],
+            index_count=data["index_count"],
+            columns=[ColumnInfo.from_dict(x) for x in data.get("columns", [])],
+            lob_storage=[LobStorageInfo.from_dict(x) for x in data.get("lob_storage", [])],
+            storage_parameters=StorageParameters.from_dict(data["storage_parameters"]) if "storage_parameters" in data else None,
+            indexes=[IndexInfo.from_dict(x) for x in data.get("indexes", [])],
+            available_columns=AvailableColumns.from_dict(data["available_columns"]) if "available_columns" in data else None,
+            is_interval=data.get("is_interval", False),
+            interval_definition=data.get("interval_definition"),
+            current_partition_count=data.get("current_partition_count"),
+            current_partition_key=data.get("current_partition_key"),
+            has_subpartitions=data.get("has_subpartitions", False),
+            subpartition_type=data.get("subpartition_type"),
+            subpartition_count=data.get("subpartition_count"),
+            grants=data.get("grants", []),
+        )
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class CommonSettings:
     """Common configurable settings for table migration"""
     new_table_name: str  # Name for the new partitioned table
@@ -571,21 +814,15 @@ class CommonSettings:
     migration_settings: MigrationSettings
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "new_table_name": self.new_table_name,
+            "old_table_name": self.old_table_name,
+            "migration_action": _convert(self.migration_action),
+            "target_configuration": _convert(self.target_configuration),
+            "migration_settings": _convert(self.migration_settings),
+        }
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CommonSettings":
         """Create instance from dictionary with proper type conversions"""
@@ -600,7 +837,7 @@ class CommonSettings:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TableConfig:
     """Complete table configuration for migration"""
     enabled: bool  # Whether this table should be migrated
@@ -610,21 +847,15 @@ class TableConfig:
     common_settings: CommonSettings
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "enabled": self.enabled,
+            "owner": self.owner,
+            "table_name": self.table_name,
+            "current_state": _convert(self.current_state),
+            "common_settings": _convert(self.common_settings),
+        }
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TableConfig":
         """Create instance from dictionary with proper type conversions"""
@@ -639,264 +870,7 @@ class TableConfig:
         )
 
 
-@dataclass
-class ConnectionDetails:
-    """Database connection details for metadata tracking"""
-    type: str = None  # Oracle connection type
-    host: str = None  # Database host
-    port: str = None  # Database port
-    service: str = None  # Oracle service name or SID
-    user: str = None  # Database user
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ConnectionDetails":
-        """Create instance from dictionary with proper type conversions"""
-        if data is None:
-            return None
-        return cls(
-            type=data.get("type"),
-            host=data.get("host"),
-            port=data.get("port"),
-            service=data.get("service"),
-            user=data.get("user"),
-        )
-
-
-@dataclass
-class Metadata:
-    """Metadata about the migration configuration"""
-    generated_date: str  # Date and time when configuration was generated
-    source_schema: str  # Oracle schema name being analyzed
-    environment: str = None  # Environment name (dev, test, prod)
-    source_database_service: str = None  # Oracle database service name
-    source_connection_details: ConnectionDetails = None
-    discovery_criteria: str = None  # Criteria used for table discovery
-    total_tables_found: int = None  # Total number of tables discovered
-    tables_selected_for_migration: int = None  # Number of tables enabled for migration
-    schema: str = None  # Alias for source_schema for backward compatibility
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Metadata":
-        """Create instance from dictionary with proper type conversions"""
-        if data is None:
-            return None
-        return cls(
-            generated_date=data["generated_date"],
-            environment=data.get("environment", "global"),
-            source_schema=data["source_schema"],
-            source_database_service=data.get("source_database_service"),
-            source_connection_details=ConnectionDetails.from_dict(data["source_connection_details"]) if "source_connection_details" in data and data["source_connection_details"] is not None else None,
-            discovery_criteria=data.get("discovery_criteria"),
-            total_tables_found=data.get("total_tables_found"),
-            tables_selected_for_migration=data.get("tables_selected_for_migration"),
-            schema=data.get("schema"),
-        )
-
-
-@dataclass
-class TablespaceConfig:
-    """Tablespace names for data and LOB storage"""
-    primary: str = None  # Primary tablespace for table data
-    lob: List[str] = field(default_factory=list)  # Array of LOB tablespaces
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "TablespaceConfig":
-        """Create instance from dictionary with proper type conversions"""
-        if data is None:
-            return None
-        return cls(
-            primary=data.get("primary"),
-            lob=data.get("lob", []),
-        )
-
-
-@dataclass
-class DataTablespaces:
-    """Tablespace configuration for data and LOB storage"""
-    data: TablespaceConfig = None
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "DataTablespaces":
-        """Create instance from dictionary with proper type conversions"""
-        if data is None:
-            return None
-        return cls(
-            data=TablespaceConfig.from_dict(data["data"]) if "data" in data and data["data"] is not None else None,
-        )
-
-
-@dataclass
-class ParallelDefaults:
-    """Default parallel execution settings"""
-    min_degree: int = None  # Minimum parallel degree
-    max_degree: int = None  # Maximum parallel degree
-    default_degree: int = None  # Default parallel degree
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ParallelDefaults":
-        """Create instance from dictionary with proper type conversions"""
-        if data is None:
-            return None
-        return cls(
-            min_degree=data.get("min_degree"),
-            max_degree=data.get("max_degree"),
-            default_degree=data.get("default_degree"),
-        )
-
-
-@dataclass
-class SubpartitionDefaults:
-    """Default settings for subpartitioning"""
-    min_count: int = None  # Minimum subpartition count
-    max_count: int = None  # Maximum subpartition count
-    size_based_recommendations: Dict[str, Any] = field(default_factory=dict)  # Size-based subpartition recommendations
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "SubpartitionDefaults":
-        """Create instance from dictionary with proper type conversions"""
-        if data is None:
-            return None
-        return cls(
-            min_count=data.get("min_count"),
-            max_count=data.get("max_count"),
-            size_based_recommendations=data.get("size_based_recommendations"),
-        )
-
-
-@dataclass
-class EnvironmentConfig:
-    """Environment-specific configuration for tablespaces and defaults"""
-    name: str  # Environment name
-    tablespaces: DataTablespaces
-    subpartition_defaults: SubpartitionDefaults = None
-    parallel_defaults: ParallelDefaults = None
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "EnvironmentConfig":
-        """Create instance from dictionary with proper type conversions"""
-        if data is None:
-            return None
-        return cls(
-            name=data["name"],
-            tablespaces=DataTablespaces.from_dict(data["tablespaces"]) if "tablespaces" in data else None,
-            subpartition_defaults=SubpartitionDefaults.from_dict(data["subpartition_defaults"]) if "subpartition_defaults" in data and data["subpartition_defaults"] is not None else None,
-            parallel_defaults=ParallelDefaults.from_dict(data["parallel_defaults"]) if "parallel_defaults" in data and data["parallel_defaults"] is not None else None,
-        )
-
-
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MigrationConfig:
     """Comprehensive schema for Oracle table migration supporting all partition types and Oracle features"""
     metadata: Metadata
@@ -904,21 +878,13 @@ class MigrationConfig:
     tables: List[TableConfig]  # Array of table configurations
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
+        """Convert to dictionary for JSON serialization - explicit per-field conversion"""
+        return {
+            "metadata": _convert(self.metadata),
+            "environment_config": _convert(self.environment_config),
+            "tables": _convert(self.tables),
+        }
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MigrationConfig":
         """Create instance from dictionary with proper type conversions"""
@@ -930,36 +896,3 @@ class MigrationConfig:
             tables=[TableConfig.from_dict(x) for x in data.get("tables", [])],
         )
 
-
-@dataclass
-class SizeRecommendation:
-    """Size-based partitioning recommendation"""
-    max_gb: float  # Maximum size in GB for this recommendation
-    count: int  # Recommended partition count
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization - explicit recursive conversion"""
-        import dataclasses
-        def convert(val):
-            if isinstance(val, Enum):
-                return val.value
-            elif dataclasses.is_dataclass(val):
-                return val.to_dict()
-            elif isinstance(val, list):
-                return [convert(v) for v in val]
-            elif isinstance(val, dict):
-                return {k: convert(v) for k, v in val.items()}
-            else:
-                return val
-        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}
-        return result
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "SizeRecommendation":
-        """Create instance from dictionary with proper type conversions"""
-        if data is None:
-            return None
-        return cls(
-            max_gb=data["max_gb"],
-            count=data["count"],
-        )
-
@@ -14,6 +14,7 @@ Key improvements:
 """
 
 import argparse
+import functools
 import json
 import sys
 from abc import ABC, abstractmethod
@@ -50,6 +51,7 @@ except ImportError:
 
 # Local imports
 # sys.path modification above requires imports here - this is intentional
+from lib import json_loader  # noqa: E402
 from lib.config_validator import ConfigValidator  # noqa: E402
 from lib.discovery_queries import TableDiscovery  # noqa: E402
 from lib.migration_models import MigrationConfig, TableConfig  # noqa: E402
@@ -289,6 +291,22 @@ class DatabaseService:
                     print(f"Note: Error closing connection: {close_error}")
 
 
+# Configs parsed ahead of time by prefetch_config(), keyed by (path, mtime_ns);
+# ConfigService.load_config() takes each entry at most once
+_PREFETCHED_CONFIGS: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+
+def prefetch_config(config_file: str) -> None:
+    """Parse a configuration file ahead of load_config (e.g. during a pause)"""
+    config_path = Path(config_file).resolve()
+    try:
+        key = (str(config_path), config_path.stat().st_mtime_ns)
+        _PREFETCHED_CONFIGS[key] = json_loader.load_file(config_path)
+    except (OSError, json.JSONDecodeError):
+        # load_config reports the problem when generation runs
+        pass
+
+
 class ConfigService:
     """Handles configuration loading and validation"""
 
@@ -303,8 +321,10 @@ class ConfigService:
 
         try:
             print(f"Loading configuration: {config_file}")
-            with open(config_path, encoding="utf-8") as f:
-                config = json.load(f)
+            key = (str(config_path.resolve()), config_path.stat().st_mtime_ns)
+            config = _PREFETCHED_CONFIGS.pop(key, None)
+            if config is None:
+                config = json_loader.load_file(config_path)
 
             print("✓ Configuration loaded")
             self._print_config_summary(config)
@@ -351,19 +371,33 @@ class ConfigService:
         print(f"  Enabled tables: {metadata.get('tables_selected_for_migration', 0)}")
 
 
+@functools.lru_cache(maxsize=None)
+def _template_environment(template_dir: str) -> Environment:
+    """
+    Build the Jinja2 environment for a template directory once per process
+
+    Generation helpers called repeatedly in one process (runner workflow)
+    share the environment, its custom filters and its compiled templates.
+    """
+    jinja_env = Environment(
+        loader=FileSystemLoader(template_dir, encoding="utf-8"),
+        autoescape=select_autoescape(),
+        trim_blocks=False,
+        lstrip_blocks=False,
+        keep_trailing_newline=True,
+        # Templates do not change during a run; skip the per-lookup stat
+        auto_reload=False,
+    )
+    register_custom_filters(jinja_env)
+    return jinja_env
+
+
 class TemplateService:
     """Handles Jinja2 template rendering"""
 
     def __init__(self, template_dir: str):
         self.template_dir = Path(template_dir)
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.template_dir), encoding="utf-8"),
-            autoescape=select_autoescape(),
-            trim_blocks=False,
-            lstrip_blocks=False,
-            keep_trailing_newline=True,
-        )
-        register_custom_filters(self.jinja_env)
+        self.jinja_env = _template_environment(str(self.template_dir.resolve()))
 
     def render_template(
         self, template_name: str, context: Dict[str, Any], output_path: Path
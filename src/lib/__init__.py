@@ -2,26 +2,41 @@
 Oracle Migration Library
 =========================
 Shared utilities for SQL execution, validation, and test orchestration.
+
+Exports are imported on first access, so importing one submodule (e.g.
+src.lib.validation_runner) does not load the test orchestration stack.
 """
 
-from .sql_executor import SQLClient, SQLExecutionResult, SQLExecutor
-from .test_config import TestConfig
-from .test_executor import ExecutionResult, StepExecutor
-from .test_orchestrator import TestOrchestrator
-from .test_reporter import TestReporter
-from .test_validator import TestValidator
-from .validation_runner import ValidationResult, ValidationRunner
-
-__all__ = [
-    "SQLExecutor",
-    "SQLClient",
-    "SQLExecutionResult",
-    "ValidationRunner",
-    "ValidationResult",
-    "TestOrchestrator",
-    "TestConfig",
-    "StepExecutor",
-    "ExecutionResult",
-    "TestValidator",
-    "TestReporter",
-]
+import importlib
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "SQLExecutor": "sql_executor",
+    "SQLClient": "sql_executor",
+    "SQLExecutionResult": "sql_executor",
+    "ValidationRunner": "validation_runner",
+    "ValidationResult": "validation_runner",
+    "READONLY_CHECKS": "validation_runner",
+    "TestOrchestrator": "test_orchestrator",
+    "TestConfig": "test_config",
+    "StepExecutor": "test_executor",
+    "ExecutionResult": "test_executor",
+    "TestValidator": "test_validator",
+    "TestReporter": "test_reporter",
+}
+
+__all__ = [*_EXPORTS, "plsql_driver"]
+
+
+def __getattr__(name):
+    if name == "plsql_driver":
+        return importlib.import_module(f"{__name__}.plsql_driver")
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
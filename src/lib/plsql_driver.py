@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+PL/SQL Driver Module
+====================
+Executes plsql-util.sql operations over a python-oracledb connection pool
+instead of spawning sqlcl/sqlplus for every call.
+"""
+
+import functools
+import importlib.util
+import re
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from .sql_executor import SQLExecutionResult
+
+# Substitution variables used by plsql-util.sql (DEFINE category = '&1' ...)
+PLSQL_UTIL_VARIABLES = (
+    "category",
+    "operation",
+    "arg3",
+    "arg4",
+    "arg5",
+    "arg6",
+    "arg7",
+)
+
+# Lines fetched per DBMS_OUTPUT.GET_LINES round-trip
+DBMS_OUTPUT_CHUNK = 100
+
+_BLOCK_RE = re.compile(r"^DECLARE\b.*?^END;[ \t]*$", re.DOTALL | re.MULTILINE)
+_QUOTED_VAR_RE = re.compile(r"'&(\w+)'")
+_EMBEDDED_VAR_RE = re.compile(r"&(\w+)\.?")
+
+# Matches all requested OWNER.TABLE names in one statement; the name list is
+# a single collection bind so the statement text never changes
+_EXISTING_TABLES_SQL = """
+SELECT owner, table_name
+FROM all_tables
+WHERE owner IN (SELECT column_value FROM TABLE(:owners))
+  AND table_name IN (SELECT column_value FROM TABLE(:tables))
+"""
+
+
+def is_available() -> bool:
+    """Check whether python-oracledb is installed (without importing it)"""
+    return importlib.util.find_spec("oracledb") is not None
+
+
+def create_pool(
+    connection: str,
+    min_sessions: int = 2,
+    max_sessions: int = 8,
+    increment: int = 1,
+    stmtcachesize: int = 40,
+):
+    """
+    Create a thin-mode connection pool
+
+    Liveness checks on acquire() are left to the driver's idle-based ping
+    (python-oracledb's default ping_interval), so no explicit validation
+    query is issued per borrow. Each session keeps a statement cache, so the
+    plsql-util.sql block (whose text never changes thanks to bind variables)
+    is not re-parsed on every call.
+
+    Args:
+        connection: Oracle connection string (user/pass@host:port/service)
+        min_sessions: Sessions opened up front
+        max_sessions: Upper bound on pooled sessions
+        increment: Sessions added when the pool grows
+        stmtcachesize: Statements cached per session
+
+    Returns:
+        oracledb.ConnectionPool
+
+    Raises:
+        ImportError: If python-oracledb is not installed
+    """
+    try:
+        import oracledb
+    except ImportError:
+        raise ImportError(
+            "python-oracledb required for pooled execution. "
+            "Install with: pip install oracledb"
+        )
+
+    return oracledb.create_pool(
+        dsn=connection,
+        min=min_sessions,
+        max=max_sessions,
+        increment=increment,
+        stmtcachesize=stmtcachesize,
+    )
+
+
+def try_create_pool(
+    connection: str, warn: Callable[[str], None] = print, **pool_args
+):
+    """
+    Create a connection pool and check that it can connect, or return None
+
+    Thin mode does not resolve everything sqlcl/sqlplus accept (e.g. some TNS
+    aliases), so callers fall back to SQLExecutor when this returns None.
+
+    Args:
+        connection: Oracle connection string
+        warn: Called with a message when the pool cannot be used
+        **pool_args: Passed to create_pool()
+
+    Returns:
+        oracledb.ConnectionPool, or None if python-oracledb is not installed
+        or cannot connect
+    """
+    if not is_available():
+        return None
+
+    import oracledb
+
+    pool = None
+    try:
+        pool = create_pool(connection, **pool_args)
+        # Thin-mode pools connect lazily; surface connection errors here
+        with pool.acquire():
+            pass
+    except oracledb.Error as e:
+        if pool is not None:
+            pool.close(force=True)
+        warn(f"oracledb pool unavailable, using the SQL client: {e}")
+        return None
+    return pool
+
+
+def load_plsql_block(plsql_script: Path) -> str:
+    """
+    Extract the anonymous PL/SQL block from plsql-util.sql
+
+    SQL*Plus substitution variables are rewritten as bind variables so the
+    block text is identical across calls and user input is never spliced
+    into the statement. Parsed blocks are cached by path and mtime, so the
+    script is only re-read after it changes on disk.
+
+    Args:
+        plsql_script: Path to plsql-util.sql
+
+    Returns:
+        PL/SQL block using :category, :operation, :arg3 ... :arg7 binds
+
+    Raises:
+        ValueError: If no DECLARE ... END; block is found
+    """
+    path = Path(plsql_script)
+    return _load_plsql_block(str(path), path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_plsql_block(path: str, mtime_ns: int) -> str:
+    """Read and convert plsql-util.sql (cached on path + mtime)"""
+    match = _BLOCK_RE.search(Path(path).read_text())
+    if not match:
+        raise ValueError(f"No PL/SQL block found in {path}")
+
+    block = _QUOTED_VAR_RE.sub(r":\1", match.group(0))
+    return _EMBEDDED_VAR_RE.sub(r"' || :\1 || '", block)
+
+
+def build_binds(category: str, operation: str, args: Sequence[str]) -> Dict[str, str]:
+    """Map category/operation/args onto the plsql-util.sql bind names"""
+    values = [category, operation] + [str(arg) for arg in args]
+    values += [None] * (len(PLSQL_UTIL_VARIABLES) - len(values))
+    return dict(zip(PLSQL_UTIL_VARIABLES, values))
+
+
+def execute_plsql_block(
+    pool, block: str, binds: Dict[str, Optional[str]]
+) -> SQLExecutionResult:
+    """
+    Run a PL/SQL block on a pooled connection and collect DBMS_OUTPUT
+
+    Args:
+        pool: oracledb.ConnectionPool to acquire a session from
+        block: PL/SQL block (see load_plsql_block)
+        binds: Bind values keyed by variable name
+
+    Returns:
+        SQLExecutionResult with DBMS_OUTPUT lines as stdout
+    """
+    start_time = time.time()
+
+    try:
+        with pool.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.callproc("dbms_output.enable", [None])
+            cursor.execute(block, binds)
+            lines = _drain_dbms_output(cursor)
+
+        return SQLExecutionResult(
+            success=True,
+            return_code=0,
+            stdout="\n".join(lines),
+            stderr="",
+            client_used="oracledb",
+            execution_time_seconds=time.time() - start_time,
+        )
+
+    except Exception as e:
+        return SQLExecutionResult(
+            success=False,
+            return_code=-1,
+            stdout="",
+            stderr=str(e),
+            client_used="oracledb",
+            execution_time_seconds=time.time() - start_time,
+        )
+
+
+def existing_tables(
+    pool, pairs: Sequence[Tuple[str, str]]
+) -> Set[Tuple[str, str]]:
+    """
+    Look up which of many tables exist in one round-trip
+
+    Names are upper-cased, matching plsql-util.sql check_existence. Owners
+    and tables are bound as separate lists so the dictionary indexes on
+    (owner, table_name) apply; rows for owner/table combinations that were
+    not asked for are dropped here.
+
+    Args:
+        pool: oracledb.ConnectionPool to acquire a session from
+        pairs: (owner, table) tuples
+
+    Returns:
+        Set of upper-cased (owner, table) tuples found in ALL_TABLES
+    """
+    wanted = {(owner.upper(), table.upper()) for owner, table in pairs}
+    with pool.acquire() as conn:
+        list_type = conn.gettype("SYS.ODCIVARCHAR2LIST")
+        cursor = conn.cursor()
+        cursor.execute(
+            _EXISTING_TABLES_SQL,
+            owners=list_type.newobject(sorted({owner for owner, _ in wanted})),
+            tables=list_type.newobject(sorted({table for _, table in wanted})),
+        )
+        return {(owner, table) for owner, table in cursor if (owner, table) in wanted}
+
+
+def _drain_dbms_output(cursor, chunk_size: int = DBMS_OUTPUT_CHUNK) -> List[str]:
+    """Fetch all buffered DBMS_OUTPUT lines, chunk_size lines per round-trip"""
+    lines: List[str] = []
+    lines_var = cursor.arrayvar(str, chunk_size)
+    num_lines_var = cursor.var(int)
+
+    while True:
+        num_lines_var.setvalue(0, chunk_size)
+        cursor.callproc("dbms_output.get_lines", (lines_var, num_lines_var))
+        num_lines = num_lines_var.getvalue()
+        lines.extend(line or "" for line in lines_var.getvalue()[:num_lines])
+        if num_lines < chunk_size:
+            return lines
@@ -6,12 +6,67 @@ Executes SQL/PL/SQL scripts with proper SQL client detection and error handling.
 Consolidates SQL execution logic from shell scripts into Python.
 """
 
+import atexit
+import functools
+import mmap
+import os
+import re
 import shutil
 import subprocess  # noqa: S404 - subprocess is needed for shell command execution
+import tempfile
+from contextlib import nullcontext
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
+from uuid import uuid4
+
+# RESULT lines printed by plsql-util.sql (also matches "VALIDATION RESULT: ..."),
+# plus bare "ERROR:" lines from the SQL client
+_RESULT_RE = re.compile(r"RESULT: (PASSED|FAILED|ERROR)|ERROR:")
+_RESULT_BYTES_RE = re.compile(_RESULT_RE.pattern.encode())
+
+# Per-operation sections in execute_plsql_util_batch output
+_SECTION_RE = re.compile(r"^---BEGIN (\d+)---$(.*?)^---END \1---$", re.M | re.S)
+
+
+@functools.lru_cache(maxsize=1)
+def _scratch_dir() -> Path:
+    """Process-wide scratch directory for batch driver scripts, removed at exit"""
+    scratch = Path(tempfile.mkdtemp(prefix="otm-val-"))
+    atexit.register(shutil.rmtree, scratch, ignore_errors=True)
+    return scratch
+
+
+def _scan_result(pattern: Pattern, buffer) -> Tuple[bool, str]:
+    """
+    Classify SQL output by its RESULT lines
+
+    PASSED wins as soon as it is seen, otherwise FAILED beats ERROR.
+
+    Args:
+        pattern: _RESULT_RE for text or _RESULT_BYTES_RE for bytes/mmap buffers
+        buffer: Output to scan
+
+    Returns:
+        Tuple of (success: bool, status_message: str)
+    """
+    found = set()
+    for match in pattern.finditer(buffer):
+        status = match.group(1)
+        if isinstance(status, bytes):
+            status = status.decode()
+        status = status or "ERROR"
+        if status == "PASSED":
+            return True, "PASSED"
+        found.add(status)
+
+    if "FAILED" in found:
+        return False, "FAILED"
+    elif "ERROR" in found:
+        return False, "ERROR"
+    else:
+        return False, "UNKNOWN"
 
 
 class SQLClient(str, Enum):
@@ -165,6 +220,67 @@ class SQLExecutor:
 
         return self._execute_command(cmd_parts, output_file, client.value)
 
+    def execute_plsql_util_batch(
+        self,
+        plsql_script: Path,
+        ops: Sequence[Dict],
+        connection: str,
+    ) -> List[SQLExecutionResult]:
+        """
+        Execute several plsql-util.sql operations in one SQL client session
+
+        Writes a driver script that PROMPTs a ---BEGIN n--- / ---END n---
+        marker around each operation, so N operations cost one client
+        start-up and one login, and the combined stdout is split back into
+        per-operation sections in a single regex pass.
+
+        Args:
+            plsql_script: Path to plsql-util.sql
+            ops: Dicts with 'category', 'operation' and 'args' keys
+            connection: Oracle connection string
+
+        Returns:
+            One SQLExecutionResult per op, with that op's section as stdout
+        """
+        lines = []
+        for i, op in enumerate(ops):
+            args_str = " ".join(str(arg) for arg in op["args"])
+            lines.extend(
+                [
+                    # Clear positional values left over from the previous op
+                    "UNDEFINE 1 2 3 4 5 6 7",
+                    f"PROMPT ---BEGIN {i}---",
+                    f"@{plsql_script} {op['category']} {op['operation']} {args_str}",
+                    f"PROMPT ---END {i}---",
+                ]
+            )
+        lines.append("EXIT")
+
+        # Unique name inside the shared scratch dir; no mkdir/rmdir per batch
+        batch_file = _scratch_dir() / f"batch-{os.getpid()}-{uuid4().hex}.sql"
+        try:
+            batch_file.write_text("\n".join(lines) + "\n")
+            result = self.execute_sql_script(batch_file, connection)
+        finally:
+            batch_file.unlink(missing_ok=True)
+
+        sections = {
+            int(match.group(1)): match.group(2)
+            for match in _SECTION_RE.finditer(result.stdout)
+        }
+
+        return [
+            SQLExecutionResult(
+                success=result.success,
+                return_code=result.return_code,
+                stdout=sections.get(i, ""),
+                stderr=result.stderr,
+                client_used=result.client_used,
+                execution_time_seconds=result.execution_time_seconds,
+            )
+            for i in range(len(ops))
+        ]
+
     def parse_sql_result(self, output_file: Path) -> Tuple[bool, str]:
         """
         Parse SQL output file for RESULT status
@@ -178,16 +294,25 @@ class SQLExecutor:
         if not output_file.exists():
             return False, "No output file found"
 
-        content = output_file.read_text()
+        # Scan the spool file through mmap so large logs are never decoded or
+        # copied into memory; only the captured status word is decoded
+        with open(output_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False, "UNKNOWN"
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _scan_result(_RESULT_BYTES_RE, mm)
 
-        if "RESULT: PASSED" in content or "VALIDATION RESULT: PASSED" in content:
-            return True, "PASSED"
-        elif "RESULT: FAILED" in content or "VALIDATION RESULT: FAILED" in content:
-            return False, "FAILED"
-        elif "RESULT: ERROR" in content or "ERROR:" in content:
-            return False, "ERROR"
-        else:
-            return False, "UNKNOWN"
+    def parse_sql_output(self, content: str) -> Tuple[bool, str]:
+        """
+        Parse captured SQL output text for RESULT status
+
+        Args:
+            content: SQL client or DBMS_OUTPUT text
+
+        Returns:
+            Tuple of (success: bool, status_message: str)
+        """
+        return _scan_result(_RESULT_RE, content)
 
     def _parse_ldap_connection(self, connection: str) -> str:
         """
@@ -237,7 +362,10 @@ class SQLExecutor:
                 print(f"Output: {output_file}")
 
         try:
-            with open(output_file, "w") if output_file else subprocess.PIPE as f:
+            stdout_target = (
+                open(output_file, "w") if output_file else nullcontext(subprocess.PIPE)
+            )
+            with stdout_target as f:
                 result = subprocess.run(
                     command,
                     stdout=f,
@@ -5,14 +5,22 @@ Test Executor Module
 Executes individual workflow steps with proper error handling and logging.
 """
 
+import contextlib
+import io
 import subprocess  # noqa: S404 - subprocess is needed for command execution
+import sys
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Deque, List, Optional, TextIO
 
 from .sql_executor import SQLExecutor
 
+# Characters of stdout/stderr kept per command; earlier output is dropped
+OUTPUT_TAIL_CHARS = 64 * 1024
+
 
 @dataclass
 class ExecutionResult:
@@ -26,6 +34,35 @@ class ExecutionResult:
     command: str
 
 
+class _OutputTail:
+    """Keep the last OUTPUT_TAIL_CHARS characters of a text stream"""
+
+    def __init__(self, limit: int = OUTPUT_TAIL_CHARS):
+        self.limit = limit
+        self.lines: Deque[str] = deque()
+        self.size = 0
+        self.dropped = 0
+
+    def consume(self, stream: TextIO, echo: Optional[TextIO] = None) -> None:
+        """Read stream to EOF line by line, optionally echoing each line"""
+        for line in stream:
+            if echo is not None:
+                echo.write(line)
+            self.lines.append(line)
+            self.size += len(line)
+            while self.size > self.limit and len(self.lines) > 1:
+                dropped = self.lines.popleft()
+                self.size -= len(dropped)
+                self.dropped += len(dropped)
+
+    def text(self) -> str:
+        """Retained output, noting how much earlier output was dropped"""
+        tail = "".join(self.lines)
+        if self.dropped:
+            return f"[... {self.dropped} earlier characters omitted ...]\n{tail}"
+        return tail
+
+
 class StepExecutor:
     """Execute individual workflow steps"""
 
@@ -149,12 +186,45 @@ class StepExecutor:
         """
         Execute schema to dataclass generation
 
+        The generator is pure Python with no database or template
+        dependencies, so it runs in this process instead of paying for a
+        fresh interpreter and re-imports; its progress output is captured
+        as stdout.
+
         Returns:
             ExecutionResult with success status and output
         """
-        cmd = ["python3", "src/schema_to_dataclass.py"]
+        start_time = time.time()
+        command_str = "python3 src/schema_to_dataclass.py (in-process)"
 
-        return self._execute_command(cmd)
+        if self.verbose:
+            print(f"Executing: {command_str}")
+
+        output = io.StringIO()
+        try:
+            from ..schema_to_dataclass import main as generate_dataclasses
+
+            with contextlib.redirect_stdout(output):
+                generate_dataclasses()
+
+            return ExecutionResult(
+                success=True,
+                return_code=0,
+                stdout=output.getvalue(),
+                stderr="",
+                duration_seconds=time.time() - start_time,
+                command=command_str,
+            )
+
+        except Exception as e:
+            return ExecutionResult(
+                success=False,
+                return_code=-1,
+                stdout=output.getvalue(),
+                stderr=str(e),
+                duration_seconds=time.time() - start_time,
+                command=command_str,
+            )
 
     def _execute_command(
         self, command: List[str], output_file: Optional[Path] = None
@@ -182,32 +252,60 @@ class StepExecutor:
             else:
                 stdout_fd = subprocess.PIPE
 
-            result = subprocess.run(
-                command,
-                shell=False,  # noqa: B602 - command is trusted (generated internally)
-                stdout=stdout_fd,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=False,
-            )
+            # Drain pipes incrementally on reader threads, keeping only the
+            # tail of each stream (echoed live when verbose)
+            stdout_tail = _OutputTail()
+            stderr_tail = _OutputTail()
+            try:
+                with subprocess.Popen(
+                    command,
+                    shell=False,  # noqa: B602 - trusted, generated internally
+                    stdout=stdout_fd,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                ) as process:
+                    readers = [
+                        threading.Thread(
+                            target=stderr_tail.consume,
+                            args=(process.stderr, sys.stderr if self.verbose else None),
+                            daemon=True,
+                        )
+                    ]
+                    if process.stdout is not None:
+                        readers.append(
+                            threading.Thread(
+                                target=stdout_tail.consume,
+                                args=(
+                                    process.stdout,
+                                    sys.stdout if self.verbose else None,
+                                ),
+                                daemon=True,
+                            )
+                        )
+                    for reader in readers:
+                        reader.start()
+                    for reader in readers:
+                        reader.join()
+                    return_code = process.wait()
+            finally:
+                if output_file:
+                    stdout_fd.close()
 
             duration = time.time() - start_time
 
             if output_file:
-                stdout_fd.close()
                 stdout = f"Output saved to {output_file}"
-                with open(output_file, "r") as f:
-                    actual_output = f.read()
-                    if len(actual_output) > 1000:
-                        stdout = f"{stdout} ({len(actual_output)} characters)"
+                output_size = output_file.stat().st_size
+                if output_size > 1000:
+                    stdout = f"{stdout} ({output_size} bytes)"
             else:
-                stdout = result.stdout or ""
+                stdout = stdout_tail.text()
 
             return ExecutionResult(
-                success=result.returncode == 0,
-                return_code=result.returncode,
+                success=return_code == 0,
+                return_code=return_code,
                 stdout=stdout,
-                stderr=result.stderr or "",
+                stderr=stderr_tail.text(),
                 duration_seconds=duration,
                 command=command_str,
             )
@@ -5,15 +5,18 @@ Test Orchestrator Module
 Orchestrates the full E2E test workflow from schema setup through validation.
 """
 
+import json
 import time
 import uuid
 from datetime import datetime
 from pathlib import Path
 
+from . import plsql_driver
 from .test_config import TestConfig
 from .test_executor import StepExecutor
 from .test_reporter import TestReporter
 from .test_validator import TestValidator
+from .validation_runner import ValidationRunner
 
 
 class TestOrchestrator:
@@ -264,7 +267,7 @@ class TestOrchestrator:
         output_dir = self.output_dir / "02_generation"
         execution_dir = self.output_dir / "03_execution"
 
-        master_scripts = list(output_dir.glob("**/master1.sql"))
+        master_scripts = self.validator.find_master_scripts(output_dir)
 
         if not master_scripts:
             raise RuntimeError("No master1.sql scripts found")
@@ -309,19 +312,64 @@ class TestOrchestrator:
         print(f"  ✓ Execution complete: {executed} scripts executed")
 
     def step7_validate_results(self):
-        """Validate migration results in Oracle"""
+        """
+        Validate migration results in Oracle
+
+        Informational: tables that fail the existence check, or a check that
+        cannot run at all, are recorded as warnings and do not fail the run.
+        """
         print("Step 7: Validating migration results...")
 
         validation_dir = self.output_dir / "04_validation"
+        config_file = self.output_dir / "01_discovery" / "config.json"
+
+        start_time = time.time()
+        try:
+            config = json.loads(config_file.read_text())
+            tables = [
+                (t["owner"], t["table_name"])
+                for t in config.get("tables", [])
+                if t.get("enabled", True)
+            ]
+
+            # Use a driver pool only when no SQL client was forced and LDAP is
+            # not in use (as cmd_validate); otherwise run through the client
+            sql_executor = self.executor.sql_executor
+            pool = None
+            if not sql_executor.explicit_client and not self.config.thin_ldap:
+                pool = plsql_driver.try_create_pool(
+                    self.config.connection_string,
+                    warn=self.results["warnings"].append,
+                    min_sessions=1,
+                )
+            runner = ValidationRunner(sql_executor=sql_executor, pool=pool)
+            try:
+                results = runner.validate_table_existence_many(
+                    tables, self.config.connection_string
+                )
+            finally:
+                if pool is not None:
+                    pool.close()
+        except Exception as e:
+            self.results["warnings"].append(f"Post-migration validation skipped: {e}")
+            results = []
+        duration = time.time() - start_time
+
+        failed = [r.message for r in results if not r.success]
+        self.results["warnings"].extend(failed)
+        self.results["metrics"]["tables_validated"] = len(results) - len(failed)
 
         self.results["steps"]["validation"] = {
             "success": True,
-            "duration": 0,
-            "message": "Validation completed",
-            "details": {"validation_dir": str(validation_dir)},
+            "duration": duration,
+            "message": f"Validated {len(results) - len(failed)}/{len(results)} tables",
+            "details": {"validation_dir": str(validation_dir), "failed": len(failed)},
         }
 
-        print("  ✓ Validation complete")
+        print(
+            f"  ✓ Validation complete: {len(results) - len(failed)}/{len(results)} "
+            f"tables ({duration:.2f}s)"
+        )
 
     def step8_generate_report(self):
         """Generate test reports"""
@@ -5,10 +5,16 @@ Test Validator Module
 Validates results at each step of the workflow.
 """
 
+import functools
 import json
-from dataclasses import dataclass
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+from lib.json_loader import load_file
 
 
 @dataclass
@@ -20,12 +26,137 @@ class ValidationResult:
     details: Dict[str, Any] = None
 
 
+@dataclass
+class _DirScan:
+    """One walk of an output directory, shared by the file validators"""
+
+    subdirs: List[Path] = field(default_factory=list)  # Top level only
+    sql_files: List[Path] = field(default_factory=list)
+    sql_sizes: List[int] = field(default_factory=list)  # Parallel to sql_files
+    json_files: List[Path] = field(default_factory=list)
+
+
+# Top-level keys every discovery config must have (tuple keeps report order)
+REQUIRED_CONFIG_FIELDS = ("metadata", "environment_config", "tables")
+REQUIRED_CONFIG_FIELD_SET = frozenset(REQUIRED_CONFIG_FIELDS)
+
+# CREATE/ALTER anywhere in a script, any case (substring match, as before)
+_SQL_KEYWORD_RE = re.compile(rb"CREATE|ALTER", re.IGNORECASE)
+
+# Threads used to walk per-table output subdirectories
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _load_json(path: Path) -> Any:
+    """
+    Parse a JSON file, reusing the result while the file is unchanged
+
+    Validators called repeatedly on the same config (discovery checks,
+    table-name checks, repeated workflow runs in one process) parse it
+    once. The result is shared and must not be mutated.
+    """
+    return _load_json_cached(*_file_key(path))
+
+
+def _file_key(path: Path) -> Tuple[str, int, int]:
+    """Cache key for a file's current contents: (resolved path, mtime, size)"""
+    stat = path.stat()
+    return str(path.resolve()), stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=16)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Read and parse a JSON file (cached on path + mtime + size)"""
+    return load_file(path)
+
+
+@functools.lru_cache(maxsize=16)
+def _config_table_names(path: str, mtime_ns: int, size: int) -> FrozenSet[str]:
+    """Table names listed in a config file (cached like _load_json_cached)"""
+    config = _load_json_cached(path, mtime_ns, size)
+    return frozenset(t.get("name") for t in config.get("tables", []))
+
+
+def _collect_file(scan: _DirScan, entry: os.DirEntry) -> None:
+    """Record a SQL (with its size) or JSON directory entry in scan"""
+    if entry.name.endswith(".sql"):
+        scan.sql_files.append(Path(entry.path))
+        scan.sql_sizes.append(entry.stat().st_size)
+    elif entry.name.endswith(".json"):
+        scan.json_files.append(Path(entry.path))
+
+
+def _walk_subtree(directory: Path) -> _DirScan:
+    """Walk one subtree iteratively, collecting its SQL and JSON files"""
+    scan = _DirScan()
+    stack = [str(directory)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    _collect_file(scan, entry)
+    return scan
+
+
 class TestValidator:
     """Validate workflow results"""
 
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
 
+    def _scan(self, output_dir: Path) -> _DirScan:
+        """
+        Walk output_dir once, collecting SQL/JSON files and SQL sizes
+
+        Uses os.scandir so each size comes from one stat per entry, and walks
+        the top-level (per-table) subdirectories on a thread pool. Each call
+        walks afresh: files rewritten inside existing subdirectories do not
+        change the root's mtime, so a cached walk could report stale sizes.
+
+        Args:
+            output_dir: Directory to walk
+
+        Returns:
+            _DirScan of the directory (empty if it does not exist)
+        """
+        scan = _DirScan()
+        try:
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        scan.subdirs.append(Path(entry.path))
+                    else:
+                        _collect_file(scan, entry)
+        except OSError:
+            return _DirScan()
+
+        # Stat/readdir release the GIL, so per-table subtrees walk in parallel;
+        # map() keeps results in subdirectory order
+        if scan.subdirs:
+            workers = min(SCAN_WORKERS, len(scan.subdirs))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for subtree in executor.map(_walk_subtree, scan.subdirs):
+                    scan.sql_files.extend(subtree.sql_files)
+                    scan.sql_sizes.extend(subtree.sql_sizes)
+                    scan.json_files.extend(subtree.json_files)
+
+        return scan
+
+    def find_master_scripts(self, output_dir: Path) -> List[Path]:
+        """
+        List the master1.sql scripts under output_dir
+
+        Args:
+            output_dir: Directory containing generated SQL files
+
+        Returns:
+            master1.sql paths, found with the same directory scan as the
+            validators
+        """
+        return [f for f in self._scan(output_dir).sql_files if f.name == "master1.sql"]
+
     def validate_discovery_config(self, config_file: Path) -> ValidationResult:
         """
         Validate generated configuration file
@@ -44,11 +175,13 @@ class TestValidator:
                     details={"file": str(config_file)},
                 )
 
-            with open(config_file, "r") as f:
-                config = json.load(f)
+            config = _load_json(config_file)
 
-            required_fields = ["metadata", "environment_config", "tables"]
-            missing_fields = [f for f in required_fields if f not in config]
+            # One C-level subset test on the common path; the ordered list of
+            # missing fields is only built when something is absent
+            missing_fields = []
+            if not REQUIRED_CONFIG_FIELD_SET <= config.keys():
+                missing_fields = [f for f in REQUIRED_CONFIG_FIELDS if f not in config]
 
             if missing_fields:
                 return ValidationResult(
@@ -107,9 +240,16 @@ class TestValidator:
                 details={"directory": str(output_dir)},
             )
 
-        master_scripts = list(output_dir.glob("**/master1.sql"))
-        non_master_sql = list(output_dir.glob("**/*.sql"))
-        non_master_sql = [f for f in non_master_sql if "master" not in f.name]
+        scan = self._scan(output_dir)
+        master_scripts = []
+        master_sizes = []
+        non_master_sql = []
+        for sql_file, size in zip(scan.sql_files, scan.sql_sizes):
+            if sql_file.name == "master1.sql":
+                master_scripts.append(sql_file)
+                master_sizes.append(size)
+            elif "master" not in sql_file.name:
+                non_master_sql.append(sql_file)
 
         if len(master_scripts) < expected_tables:
             return ValidationResult(
@@ -122,10 +262,11 @@ class TestValidator:
                 },
             )
 
-        empty_files = []
-        for sql_file in master_scripts:
-            if sql_file.stat().st_size == 0:
-                empty_files.append(str(sql_file))
+        empty_files = [
+            str(sql_file)
+            for sql_file, size in zip(master_scripts, master_sizes)
+            if size == 0
+        ]
 
         if empty_files:
             return ValidationResult(
@@ -155,15 +296,16 @@ class TestValidator:
             ValidationResult with validation details
         """
         try:
-            content = sql_file.read_text()
+            # Raw bytes: each check is one C-level scan, with no decode or
+            # upper-cased copy of the file
+            content = sql_file.read_bytes()
 
             checks = {
                 "not_empty": len(content.strip()) > 0,
-                "has_semicolons": ";" in content,
-                "has_create_or_alter": "CREATE" in content.upper()
-                or "ALTER" in content.upper(),
-                "balanced_quotes": content.count('"') % 2 == 0,
-                "balanced_parentheses": content.count("(") == content.count(")"),
+                "has_semicolons": b";" in content,
+                "has_create_or_alter": _SQL_KEYWORD_RE.search(content) is not None,
+                "balanced_quotes": content.count(b'"') % 2 == 0,
+                "balanced_parentheses": content.count(b"(") == content.count(b")"),
             }
 
             failed_checks = [k for k, v in checks.items() if not v]
@@ -186,6 +328,29 @@ class TestValidator:
                 details={"error": str(e)},
             )
 
+    def validate_sql_structure_batch(
+        self, sql_files: List[Path]
+    ) -> Dict[Path, ValidationResult]:
+        """
+        Validate SQL structure of many files, overlapping their reads
+
+        File reads release the GIL, so the files are checked on a thread
+        pool instead of one blocking read after another.
+
+        Args:
+            sql_files: SQL files to validate
+
+        Returns:
+            ValidationResult per file, in input order
+        """
+        if not sql_files:
+            return {}
+
+        workers = min(SCAN_WORKERS, len(sql_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self.validate_sql_structure, sql_files)
+            return dict(zip(sql_files, results))
+
     def validate_file_sizes(
         self, output_dir: Path, min_size_bytes: int = 100
     ) -> ValidationResult:
@@ -199,25 +364,24 @@ class TestValidator:
         Returns:
             ValidationResult with file size details
         """
-        sql_files = list(output_dir.glob("**/*.sql"))
-        small_files = [f for f in sql_files if f.stat().st_size < min_size_bytes]
+        scan = self._scan(output_dir)
+        sql_files = scan.sql_files
+        small_files = [
+            (f, size)
+            for f, size in zip(sql_files, scan.sql_sizes)
+            if size < min_size_bytes
+        ]
 
         if small_files:
             return ValidationResult(
                 passed=False,
                 message=f"Found {len(small_files)} files smaller than {min_size_bytes} bytes",
                 details={
-                    "small_files": [
-                        (str(f), f.stat().st_size) for f in small_files[:10]
-                    ]
+                    "small_files": [(str(f), size) for f, size in small_files[:10]]
                 },
             )
 
-        avg_size = (
-            sum(f.stat().st_size for f in sql_files) / len(sql_files)
-            if sql_files
-            else 0
-        )
+        avg_size = sum(scan.sql_sizes) / len(sql_files) if sql_files else 0
 
         return ValidationResult(
             passed=True,
@@ -239,9 +403,10 @@ class TestValidator:
         Returns:
             ValidationResult with structure details
         """
-        subdirs = [d for d in output_dir.iterdir() if d.is_dir()]
-        sql_files = list(output_dir.glob("**/*.sql"))
-        json_files = list(output_dir.glob("**/*.json"))
+        scan = self._scan(output_dir)
+        subdirs = scan.subdirs
+        sql_files = scan.sql_files
+        json_files = scan.json_files
 
         if not subdirs and not sql_files:
             return ValidationResult(
@@ -275,11 +440,8 @@ class TestValidator:
             ValidationResult with matching details
         """
         try:
-            with open(config_file, "r") as f:
-                config = json.load(f)
-
-            config_tables = {t.get("name") for t in config.get("tables", [])}
-            sql_table_dirs = {d.name for d in sql_dirs if d.is_dir()}
+            config_tables = _config_table_names(*_file_key(config_file))
+            sql_table_dirs = frozenset(d.name for d in sql_dirs if d.is_dir())
 
             missing = config_tables - sql_table_dirs
             extra = sql_table_dirs - config_tables
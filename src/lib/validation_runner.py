@@ -6,38 +6,145 @@ Provides high-level validation functions that invoke plsql-util.sql
 for database validation operations.
 """
 
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, List, Optional, Sequence, Tuple
 
+from . import plsql_driver
 from .sql_executor import SQLExecutionResult, SQLExecutor
 
 
+# Bundled plsql-util.sql, resolved once relative to the repository root
+DEFAULT_PLSQL_UTIL = (
+    Path(__file__).resolve().parent.parent.parent
+    / "templates"
+    / "plsql-util"
+    / "plsql-util.sql"
+)
+
+# Independent READONLY checks, runnable side by side (validate_many/batch)
+READONLY_CHECKS = ("check_existence", "count_rows", "check_constraints")
+
+
+# Per-stage status lines printed by the WORKFLOW swap_full operation
+_SWAP_STAGE_RE = re.compile(r"^(PRE_SWAP|SWAP|POST_SWAP): (\w+)", re.MULTILINE)
+
+
+# ValidationResult kind for each of READONLY_CHECKS
+_CHECK_KINDS = {
+    "check_existence": "existence",
+    "count_rows": "row_count",
+    "check_constraints": "constraints",
+}
+
+# Message templates per result kind: (failure, success)
+_MESSAGE_TEMPLATES = {
+    "existence": (
+        "Table {owner}.{table} does not exist",
+        "Table {owner}.{table} exists",
+    ),
+    "row_count": ("Row count validation for {owner}.{table}{detail}",) * 2,
+    "constraints": ("Constraint validation for {owner}.{table}",) * 2,
+    "pre_swap": ("Pre-swap validation for {owner}.{table}",) * 2,
+    "post_swap": ("Post-swap validation for {owner}.{table}",) * 2,
+    "swap_workflow": ("Swap workflow for {owner}.{table}{detail}",) * 2,
+    "skipped": ("Skipped due to prior failure",) * 2,
+}
+
+
 @dataclass
 class ValidationResult:
     """Result of a validation operation"""
 
     success: bool
-    message: str
     status: str
+    kind: str
+    owner: str = ""
+    table: str = ""
+    detail: str = ""
     execution_result: Optional[SQLExecutionResult] = None
 
+    @property
+    def message(self) -> str:
+        """Human-readable summary, formatted only when requested"""
+        return _MESSAGE_TEMPLATES[self.kind][self.success].format(
+            owner=self.owner, table=self.table, detail=self.detail
+        )
+
 
 class ValidationRunner:
     """Execute validation operations via plsql-util.sql"""
 
     def __init__(
-        self, plsql_util_path: Path, sql_executor: Optional[SQLExecutor] = None
+        self,
+        plsql_util_path: Optional[Path] = None,
+        sql_executor: Optional[SQLExecutor] = None,
+        pool=None,
     ):
         """
         Initialize validation runner
 
         Args:
-            plsql_util_path: Path to plsql-util.sql script
+            plsql_util_path: Path to plsql-util.sql script (defaults to
+                DEFAULT_PLSQL_UTIL)
             sql_executor: Optional SQLExecutor instance (creates new one if not provided)
+            pool: Optional oracledb connection pool; when set, operations run
+                over the driver instead of spawning a SQL client
         """
-        self.plsql_util_path = Path(plsql_util_path)
+        self.plsql_util_path = (
+            Path(plsql_util_path) if plsql_util_path else DEFAULT_PLSQL_UTIL
+        )
         self.sql_executor = sql_executor or SQLExecutor(verbose=True)
+        self.pool = pool
+
+    def _exec_plsql(
+        self,
+        category: str,
+        operation: str,
+        args: List[str],
+        connection: str,
+        output_file: Optional[Path] = None,
+    ) -> Tuple[SQLExecutionResult, bool, str]:
+        """
+        Run a plsql-util.sql operation and parse its RESULT status
+
+        Uses the connection pool when one was provided, otherwise falls back
+        to SQLExecutor (sqlcl/sqlplus).
+
+        Returns:
+            Tuple of (execution result, success, status)
+        """
+        if self.pool is None:
+            result = self.sql_executor.execute_plsql_util(
+                plsql_script=self.plsql_util_path,
+                category=category,
+                operation=operation,
+                args=args,
+                connection=connection,
+                output_file=output_file,
+            )
+            success, status = (
+                self.sql_executor.parse_sql_result(output_file)
+                if output_file
+                else self.sql_executor.parse_sql_output(result.stdout)
+            )
+            return result, success, status
+
+        result = plsql_driver.execute_plsql_block(
+            self.pool,
+            plsql_driver.load_plsql_block(self.plsql_util_path),
+            plsql_driver.build_binds(category, operation, args),
+        )
+        if not result.success:
+            return result, False, "ERROR"
+
+        if output_file:
+            output_file.write_text(result.stdout)
+
+        success, status = self.sql_executor.parse_sql_output(result.stdout)
+        return result, success, status
 
     def validate_table_existence(
         self,
@@ -59,32 +166,77 @@ class ValidationRunner:
             ValidationResult indicating success and details
         """
         args = [owner, table]
-        result = self.sql_executor.execute_plsql_util(
-            plsql_script=self.plsql_util_path,
-            category="READONLY",
-            operation="check_existence",
-            args=args,
-            connection=connection,
-            output_file=output_file,
-        )
-
-        success, status = (
-            self.sql_executor.parse_sql_result(output_file)
-            if output_file
-            else (False, "UNKNOWN")
+        result, success, status = self._exec_plsql(
+            "READONLY", "check_existence", args, connection, output_file
         )
 
         return ValidationResult(
             success=success,
-            message=(
-                f"Table {owner}.{table} exists"
-                if success
-                else f"Table {owner}.{table} does not exist"
-            ),
             status=status,
+            kind="existence",
+            owner=owner,
+            table=table,
             execution_result=result,
         )
 
+    def validate_table_existence_many(
+        self,
+        pairs: Sequence[Tuple[str, str]],
+        connection: str,
+    ) -> List[ValidationResult]:
+        """
+        Validate that many tables exist
+
+        With a connection pool all tables are checked by a single query;
+        otherwise the checks share one SQL client session via
+        validate_batch().
+
+        Args:
+            pairs: (owner, table) tuples
+            connection: Oracle connection string
+
+        Returns:
+            ValidationResults in the same order as pairs
+        """
+        if self.pool is None:
+            return self.validate_batch(
+                [(owner, table, "check_existence") for owner, table in pairs],
+                connection,
+            )
+        if not pairs:
+            return []
+
+        execution = None
+        try:
+            found = plsql_driver.existing_tables(self.pool, pairs)
+        except Exception as e:
+            execution = SQLExecutionResult(
+                success=False,
+                return_code=-1,
+                stdout="",
+                stderr=str(e),
+                client_used="oracledb",
+                execution_time_seconds=0.0,
+            )
+            statuses = ["ERROR"] * len(pairs)
+        else:
+            statuses = [
+                "PASSED" if (owner.upper(), table.upper()) in found else "FAILED"
+                for owner, table in pairs
+            ]
+
+        return [
+            ValidationResult(
+                success=status == "PASSED",
+                status=status,
+                kind="existence",
+                owner=owner,
+                table=table,
+                execution_result=execution,
+            )
+            for (owner, table), status in zip(pairs, statuses)
+        ]
+
     def validate_row_count(
         self,
         owner: str,
@@ -110,27 +262,18 @@ class ValidationRunner:
         if expected is not None:
             args.append(str(expected))
 
-        result = self.sql_executor.execute_plsql_util(
-            plsql_script=self.plsql_util_path,
-            category="READONLY",
-            operation="count_rows",
-            args=args,
-            connection=connection,
-            output_file=output_file,
+        result, success, status = self._exec_plsql(
+            "READONLY", "count_rows", args, connection, output_file
         )
 
-        success, status = (
-            self.sql_executor.parse_sql_result(output_file)
-            if output_file
-            else (False, "UNKNOWN")
-        )
-
-        message = f"Row count validation for {owner}.{table}"
-        if expected is not None:
-            message += f" (expected: {expected})"
-
         return ValidationResult(
-            success=success, message=message, status=status, execution_result=result
+            success=success,
+            status=status,
+            kind="row_count",
+            owner=owner,
+            table=table,
+            detail=f" (expected: {expected})" if expected is not None else "",
+            execution_result=result,
         )
 
     def validate_constraints(
@@ -153,25 +296,16 @@ class ValidationRunner:
             ValidationResult with constraint validation details
         """
         args = [owner, table]
-        result = self.sql_executor.execute_plsql_util(
-            plsql_script=self.plsql_util_path,
-            category="READONLY",
-            operation="check_constraints",
-            args=args,
-            connection=connection,
-            output_file=output_file,
-        )
-
-        success, status = (
-            self.sql_executor.parse_sql_result(output_file)
-            if output_file
-            else (False, "UNKNOWN")
+        result, success, status = self._exec_plsql(
+            "READONLY", "check_constraints", args, connection, output_file
         )
 
         return ValidationResult(
             success=success,
-            message=f"Constraint validation for {owner}.{table}",
             status=status,
+            kind="constraints",
+            owner=owner,
+            table=table,
             execution_result=result,
         )
 
@@ -187,6 +321,9 @@ class ValidationRunner:
         """
         Validate pre-swap conditions
 
+        Read-only check. validate_swap_workflow() runs this check too, but it
+        also renames the tables (SWAP_FULL), so it is not a substitute.
+
         Args:
             owner: Schema owner
             table: Original table name
@@ -199,25 +336,16 @@ class ValidationRunner:
             ValidationResult with pre-swap validation details
         """
         args = [owner, table, new_table, old_table]
-        result = self.sql_executor.execute_plsql_util(
-            plsql_script=self.plsql_util_path,
-            category="WORKFLOW",
-            operation="pre_swap",
-            args=args,
-            connection=connection,
-            output_file=output_file,
-        )
-
-        success, status = (
-            self.sql_executor.parse_sql_result(output_file)
-            if output_file
-            else (False, "UNKNOWN")
+        result, success, status = self._exec_plsql(
+            "WORKFLOW", "pre_swap", args, connection, output_file
         )
 
         return ValidationResult(
             success=success,
-            message=f"Pre-swap validation for {owner}.{table}",
             status=status,
+            kind="pre_swap",
+            owner=owner,
+            table=table,
             execution_result=result,
         )
 
@@ -232,6 +360,9 @@ class ValidationRunner:
         """
         Validate post-swap conditions
 
+        Read-only check. validate_swap_workflow() runs this check too, but it
+        also renames the tables (SWAP_FULL), so it is not a substitute.
+
         Args:
             owner: Schema owner
             table: Current table name (after swap)
@@ -243,24 +374,234 @@ class ValidationRunner:
             ValidationResult with post-swap validation details
         """
         args = [owner, table, old_table]
-        result = self.sql_executor.execute_plsql_util(
-            plsql_script=self.plsql_util_path,
-            category="WORKFLOW",
-            operation="post_swap",
-            args=args,
-            connection=connection,
-            output_file=output_file,
+        result, success, status = self._exec_plsql(
+            "WORKFLOW", "post_swap", args, connection, output_file
+        )
+
+        return ValidationResult(
+            success=success,
+            status=status,
+            kind="post_swap",
+            owner=owner,
+            table=table,
+            execution_result=result,
+        )
+
+    def validate_swap_workflow(
+        self,
+        owner: str,
+        table: str,
+        new_table: str,
+        old_table: str,
+        connection: str,
+        output_file: Optional[Path] = None,
+    ) -> ValidationResult:
+        """
+        Pre-check, swap and post-check a table in a single server call
+
+        Replaces a validate_pre_swap / swap / validate_post_swap sequence
+        with one round-trip to the WORKFLOW swap_full operation.
+
+        Args:
+            owner: Schema owner
+            table: Original table name
+            new_table: New table name (renamed to table)
+            old_table: Backup name for the original table
+            connection: Oracle connection string
+            output_file: Optional path to save output
+
+        Returns:
+            ValidationResult with overall status; per-stage statuses are
+            included in the message
+        """
+        args = [owner, table, new_table, old_table]
+        result, success, status = self._exec_plsql(
+            "WORKFLOW", "swap_full", args, connection, output_file
         )
 
-        success, status = (
-            self.sql_executor.parse_sql_result(output_file)
-            if output_file
-            else (False, "UNKNOWN")
+        output = output_file.read_text() if output_file else result.stdout
+        stages = dict(_SWAP_STAGE_RE.findall(output))
+        stage_summary = ", ".join(
+            f"{name.lower()}: {stages.get(name, 'SKIPPED')}"
+            for name in ("PRE_SWAP", "SWAP", "POST_SWAP")
         )
 
         return ValidationResult(
             success=success,
-            message=f"Post-swap validation for {owner}.{table}",
             status=status,
+            kind="swap_workflow",
+            owner=owner,
+            table=table,
+            detail=f" ({stage_summary})",
             execution_result=result,
         )
+
+    def validate_chain(
+        self,
+        steps: Sequence[Callable[[], ValidationResult]],
+        short_circuit: bool = True,
+    ) -> List[ValidationResult]:
+        """
+        Run dependent validation steps in order
+
+        Args:
+            steps: Zero-argument callables returning a ValidationResult
+            short_circuit: Stop at the first failure and mark the remaining
+                steps SKIPPED; pass False to run every step (diagnostics)
+
+        Returns:
+            One ValidationResult per step, in order
+        """
+        results: List[ValidationResult] = []
+        for step in steps:
+            if short_circuit and results and not results[-1].success:
+                results.append(
+                    ValidationResult(success=False, status="SKIPPED", kind="skipped")
+                )
+                continue
+            results.append(step())
+        return results
+
+    def validate_many(
+        self,
+        items: Sequence[Tuple[str, str, str]],
+        connection: str,
+        max_workers: int = 8,
+        expected: Optional[int] = None,
+    ) -> List[ValidationResult]:
+        """
+        Run READONLY checks for many tables on a thread pool
+
+        Only READONLY_CHECKS are accepted; WORKFLOW operations depend on
+        ordering and must be run sequentially by the caller.
+
+        Args:
+            items: (owner, table, operation) tuples
+            connection: Oracle connection string
+            max_workers: Upper bound on concurrent checks
+            expected: Expected row count for count_rows items (None for info only)
+
+        Returns:
+            ValidationResults in the same order as items
+
+        Raises:
+            ValueError: If an item names a non-READONLY operation
+        """
+        unknown = sorted({op for _, _, op in items if op not in READONLY_CHECKS})
+        if unknown:
+            raise ValueError(f"validate_many only runs READONLY checks: {unknown}")
+        if not items:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(
+                executor.map(
+                    lambda item: self.validate_check(
+                        item[2], item[0], item[1], connection, expected
+                    ),
+                    items,
+                )
+            )
+
+    def validate_batch(
+        self,
+        items: Sequence[Tuple[str, str, str]],
+        connection: str,
+        expected: Optional[int] = None,
+    ) -> List[ValidationResult]:
+        """
+        Run READONLY checks for many tables with one SQL client start-up
+
+        Without a connection pool every check would spawn its own
+        sqlcl/sqlplus process; here they share a single session and the
+        combined output is split back per check. With a pool this simply
+        delegates to validate_many().
+
+        Args:
+            items: (owner, table, operation) tuples
+            connection: Oracle connection string
+            expected: Expected row count for count_rows items (None for info only)
+
+        Returns:
+            ValidationResults in the same order as items
+
+        Raises:
+            ValueError: If an item names a non-READONLY operation
+        """
+        if self.pool is not None:
+            return self.validate_many(items, connection, expected=expected)
+
+        unknown = sorted({op for _, _, op in items if op not in READONLY_CHECKS})
+        if unknown:
+            raise ValueError(f"validate_batch only runs READONLY checks: {unknown}")
+        if not items:
+            return []
+
+        count_extra = [str(expected)] if expected is not None else []
+        count_detail = f" (expected: {expected})" if expected is not None else ""
+
+        executions = self.sql_executor.execute_plsql_util_batch(
+            plsql_script=self.plsql_util_path,
+            ops=[
+                {
+                    "category": "READONLY",
+                    "operation": op,
+                    "args": [owner, table]
+                    + (count_extra if op == "count_rows" else []),
+                }
+                for owner, table, op in items
+            ],
+            connection=connection,
+        )
+
+        results = []
+        for (owner, table, op), execution in zip(items, executions):
+            success, status = self.sql_executor.parse_sql_output(execution.stdout)
+            results.append(
+                ValidationResult(
+                    success=success,
+                    status=status,
+                    kind=_CHECK_KINDS[op],
+                    owner=owner,
+                    table=table,
+                    detail=count_detail if op == "count_rows" else "",
+                    execution_result=execution,
+                )
+            )
+        return results
+
+    def validate_check(
+        self,
+        operation: str,
+        owner: str,
+        table: str,
+        connection: str,
+        expected: Optional[int] = None,
+        output_file: Optional[Path] = None,
+    ) -> ValidationResult:
+        """
+        Run one of READONLY_CHECKS by name
+
+        Args:
+            operation: check_existence, count_rows or check_constraints
+            owner: Schema owner
+            table: Table name
+            connection: Oracle connection string
+            expected: Expected row count for count_rows (None for info only)
+            output_file: Optional path to save output
+
+        Returns:
+            ValidationResult from the matching validate_* method
+
+        Raises:
+            ValueError: If operation is not one of READONLY_CHECKS
+        """
+        if operation == "check_existence":
+            return self.validate_table_existence(owner, table, connection, output_file)
+        if operation == "count_rows":
+            return self.validate_row_count(
+                owner, table, expected, connection, output_file
+            )
+        if operation == "check_constraints":
+            return self.validate_constraints(owner, table, connection, output_file)
+        raise ValueError(f"Unknown READONLY check: {operation}")
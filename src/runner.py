@@ -17,21 +17,39 @@ Commands:
 """
 
 import argparse
+import functools
+import os
 import sys
+import threading
 from pathlib import Path
+from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.lib import (
-    SQLExecutor,
-    TestConfig,
-    TestOrchestrator,
-    ValidationRunner,
-)
+
+def _require_file(path: str, label: str) -> Optional[Path]:
+    """
+    Resolve a required input file with a single stat
+
+    Args:
+        path: File path from the command line
+        label: Name used in the error message
+
+    Returns:
+        Path to the file, or None (after printing an error) if it is missing
+    """
+    file_path = Path(path)
+    if not file_path.is_file():
+        print(f"ERROR: {label} not found: {file_path}")
+        return None
+    return file_path
 
 
 def cmd_test(args):
     """Execute full E2E test workflow"""
+    from src.lib.test_config import TestConfig
+    from src.lib.test_orchestrator import TestOrchestrator
+
     config = TestConfig.from_args(args)
     orchestrator = TestOrchestrator(config)
     orchestrator.run()
@@ -40,26 +58,34 @@ def cmd_test(args):
 
 def cmd_validate(args):
     """Execute validation operations"""
-    import tempfile
+    from src.lib import plsql_driver
+    from src.lib.sql_executor import SQLExecutor
+    from src.lib.validation_runner import (
+        DEFAULT_PLSQL_UTIL,
+        READONLY_CHECKS,
+        ValidationRunner,
+    )
 
     if not args.connection:
         print("ERROR: Connection string required (--connection)")
         return 1
 
-    plsql_util = Path("templates/plsql-util/plsql-util.sql")
-    if not plsql_util.exists():
-        print(f"ERROR: plsql-util.sql not found at {plsql_util}")
+    if not DEFAULT_PLSQL_UTIL.is_file():
+        print(f"ERROR: plsql-util.sql not found at {DEFAULT_PLSQL_UTIL}")
         return 1
 
-    thin_ldap = getattr(args, "thin_ldap", False)
-    sql_executor = SQLExecutor(
-        explicit_client=args.sql_client, thin_ldap=thin_ldap, verbose=args.verbose
-    )
-    validation_runner = ValidationRunner(
-        plsql_util_path=plsql_util, sql_executor=sql_executor
-    )
+    if args.operation == "all":
+        operations = list(READONLY_CHECKS)
+    else:
+        operations = [op.strip() for op in args.operation.split(",") if op.strip()]
+    unknown = [op for op in operations if op not in READONLY_CHECKS]
+    if not operations or unknown:
+        print(f"ERROR: Unknown operation: {', '.join(unknown) or args.operation}")
+        print(f"Valid operations: {', '.join(READONLY_CHECKS)}, all")
+        return 1
 
-    operation = args.operation
+    # Normalized name(s): a single op loses stray commas and whitespace
+    operation = ",".join(operations)
     operation_args = args.args
 
     if len(operation_args) < 2:
@@ -71,21 +97,59 @@ def cmd_validate(args):
     table = operation_args[1]
     additional = operation_args[2:] if len(operation_args) > 2 else []
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_file = Path(tmpdir) / "validation_output.log"
+    thin_ldap = getattr(args, "thin_ldap", False)
+    sql_executor = SQLExecutor(
+        explicit_client=args.sql_client, thin_ldap=thin_ldap, verbose=args.verbose
+    )
+
+    # Prefer a pooled python-oracledb session unless a SQL client is forced or
+    # the connection needs the client's LDAP handling
+    pool = None
+    if not args.sql_client and not thin_ldap:
+        pool = plsql_driver.try_create_pool(args.connection, min_sessions=1)
+
+    validation_runner = ValidationRunner(sql_executor=sql_executor, pool=pool)
+
+    try:
+        if len(operations) > 1:
+            expected = int(additional[0]) if additional else None
+            if args.fail_fast:
+                results = validation_runner.validate_chain(
+                    [
+                        functools.partial(
+                            validation_runner.validate_check,
+                            op,
+                            owner,
+                            table,
+                            args.connection,
+                            expected,
+                        )
+                        for op in operations
+                    ]
+                )
+            else:
+                # One SQL client session (or pooled sessions) for all checks
+                results = validation_runner.validate_batch(
+                    [(owner, table, op) for op in operations],
+                    args.connection,
+                    expected=expected,
+                )
+            for result in results:
+                print(f"{'✓' if result.success else '✗'} {result.message}")
+            return 0 if all(r.success for r in results) else 1
 
         if operation == "check_existence":
             result = validation_runner.validate_table_existence(
-                owner, table, args.connection, output_file
+                owner, table, args.connection
             )
         elif operation == "count_rows":
             expected = int(additional[0]) if additional else None
             result = validation_runner.validate_row_count(
-                owner, table, expected, args.connection, output_file
+                owner, table, expected, args.connection
             )
         elif operation == "check_constraints":
             result = validation_runner.validate_constraints(
-                owner, table, args.connection, output_file
+                owner, table, args.connection
             )
         else:
             print(f"ERROR: Unknown operation: {operation}")
@@ -97,6 +161,9 @@ def cmd_validate(args):
         else:
             print(f"✗ {result.message}")
             return 1
+    finally:
+        if pool is not None:
+            pool.close()
 
 
 def cmd_migrate(args):
@@ -134,13 +201,12 @@ def cmd_generate(args):
         print("ERROR: Config file required (--config)")
         return 1
 
-    from src.generate import run_generation
-
-    config_file = Path(args.config)
-    if not config_file.exists():
-        print(f"ERROR: Config file not found: {config_file}")
+    config_file = _require_file(args.config, "Config file")
+    if config_file is None:
         return 1
 
+    from src.generate import run_generation
+
     output_dir = Path(args.output_dir) if args.output_dir else None
     return 0 if run_generation(config_file, output_dir) else 1
 
@@ -154,9 +220,22 @@ def wait_for_user():
         sys.exit(130)
 
 
+def _latest_run(output_dir: Path) -> Optional[Path]:
+    """Newest timestamped (202*) run directory, found in one scandir pass"""
+    if not output_dir.is_dir():
+        return None
+    with os.scandir(output_dir) as entries:
+        latest = max(
+            (e for e in entries if e.name.startswith("202") and e.is_dir()),
+            key=lambda e: e.name,
+            default=None,
+        )
+    return Path(latest.path) if latest else None
+
+
 def cmd_workflow(args):
     """Complete E2E workflow: discover -> generate -> validate -> execute"""
-    from src.generate import run_discovery, run_generation
+    from src.generate import prefetch_config, run_discovery, run_generation
     
     if not args.schema:
         print("ERROR: Schema required for workflow (--schema)")
@@ -187,6 +266,10 @@ def cmd_workflow(args):
     
     if pause_enabled:
         print("\n📋 Review the discovery results above before proceeding.")
+        # Parse the config while waiting so generation starts right after Enter
+        threading.Thread(
+            target=prefetch_config, args=(config_file,), daemon=True
+        ).start()
         wait_for_user()
     
     print("\n" + "=" * 70)
@@ -203,11 +286,13 @@ def cmd_workflow(args):
     print("\n✓ DDL generation complete!")
 
     # Show summary
-    timestamped_dirs = list(output_dir.glob("202*"))
-    if timestamped_dirs:
-        latest_output = sorted(timestamped_dirs)[-1]
-        table_dirs = list(latest_output.glob("APP_*"))
-        print(f"✓ Generated DDL for {len(table_dirs)} tables")
+    latest_output = _latest_run(output_dir)
+    if latest_output:
+        with os.scandir(latest_output) as entries:
+            table_count = sum(
+                1 for e in entries if e.name.startswith("APP_") and e.is_dir()
+            )
+        print(f"✓ Generated DDL for {table_count} tables")
         print(f"✓ Output location: {latest_output}")
 
     if pause_enabled:
@@ -238,15 +323,14 @@ def cmd_deploy(args):
         print("ERROR: Script file required (--script)")
         return 1
 
-    script_path = Path(args.script)
-    if not script_path.exists():
-        print(f"ERROR: Script file not found: {script_path}")
+    script_path = _require_file(args.script, "Script file")
+    if script_path is None:
         return 1
 
     from src.lib.sql_executor import SQLExecutor
 
     thin_ldap = getattr(args, "thin_ldap", False)
-    executor = SQLExecutor(
+    sql_executor = SQLExecutor(
         explicit_client=args.sql_client, thin_ldap=thin_ldap, verbose=args.verbose
     )
 
@@ -254,13 +338,16 @@ def cmd_deploy(args):
     print(f"Connection: {args.connection}")
 
     # Execute the script
-    result = executor.execute_script(str(script_path), args.connection)
+    result = sql_executor.execute_sql_script(script_path, args.connection)
+    if args.verbose:
+        print(result.stdout)
 
     if result.success:
         print("✓ Deployment successful")
         return 0
     else:
-        print(f"✗ Deployment failed: {result.message}")
+        reason = result.stderr or f"exit code {result.return_code}"
+        print(f"✗ Deployment failed: {reason}")
         return 1
 
 
@@ -270,15 +357,16 @@ def cmd_setup(args):
         print("ERROR: Connection required (--connection)")
         return 1
 
-    ddl_script = Path("templates/test/comprehensive_oracle_ddl.sql")
-    if not ddl_script.exists():
-        print(f"ERROR: DDL script not found: {ddl_script}")
+    ddl_script = _require_file(
+        "templates/test/comprehensive_oracle_ddl.sql", "DDL script"
+    )
+    if ddl_script is None:
         return 1
 
     from src.lib.sql_executor import SQLExecutor
 
     thin_ldap = getattr(args, "thin_ldap", False)
-    executor = SQLExecutor(
+    sql_executor = SQLExecutor(
         explicit_client=args.sql_client, thin_ldap=thin_ldap, verbose=args.verbose
     )
 
@@ -289,7 +377,9 @@ def cmd_setup(args):
     print(f"Connection: {args.connection}")
 
     # Execute the script
-    result = executor.execute_script(str(ddl_script), args.connection)
+    result = sql_executor.execute_sql_script(ddl_script, args.connection)
+    if args.verbose:
+        print(result.stdout)
 
     if result.success:
         print("\n✓ Setup complete! Test environment created successfully.")
@@ -297,36 +387,13 @@ def cmd_setup(args):
         print("  python3 src/runner.py workflow --schema APP_DATA_OWNER --connection <conn>")
         return 0
     else:
-        print(f"\n✗ Setup failed: {result.message}")
+        reason = result.stderr or f"exit code {result.return_code}"
+        print(f"\n✗ Setup failed: {reason}")
         return 1
 
 
-def main():
-    """Main entry point"""
-    parser = argparse.ArgumentParser(
-        description="Unified Oracle Migration Runner",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Complete E2E workflow (discover + generate with interactive pauses)
-  python3 src/runner.py workflow --schema APP_DATA_OWNER --connection "$ORACLE_CONN"
-
-  # Deploy generated DDL to database
-  python3 src/runner.py deploy --script output/202*/APP_DATA_OWNER_TABLE/master1.sql --connection "$ORACLE_CONN"
-
-  # Individual steps
-  python3 src/runner.py discover --schema APP_DATA_OWNER --connection "$ORACLE_CONN"
-  python3 src/runner.py generate --config output/202*/migration_config.json
-  python3 src/runner.py validate check_existence APP_OWNER MY_TABLE --connection "$ORACLE_CONN"
-
-  # Full E2E test
-  python3 src/runner.py test --connection "$ORACLE_CONN" --schema APP_DATA_OWNER
-        """,
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
-
-    # test subcommand
+def _add_test_parser(subparsers):
+    """Add the test subcommand"""
     parser_test = subparsers.add_parser("test", help="Full E2E test workflow")
     parser_test.add_argument(
         "--connection", required=True, help="Oracle connection string"
@@ -347,20 +414,30 @@ Examples:
     parser_test.add_argument(
         "--verbose", action="store_true", help="Enable verbose output"
     )
+    parser_test.set_defaults(func=cmd_test)
+
 
-    # validate subcommand
+def _add_validate_parser(subparsers):
+    """Add the validate subcommand"""
     parser_validate = subparsers.add_parser(
         "validate", help="Database validation operations"
     )
     parser_validate.add_argument(
         "operation",
-        choices=["check_existence", "count_rows", "check_constraints"],
-        help="Validation operation",
+        help=(
+            "Validation operation (check_existence, count_rows, check_constraints); "
+            "comma-separate several, or use 'all', to run them together"
+        ),
     )
     parser_validate.add_argument("args", nargs="*", help="Arguments for the operation")
     parser_validate.add_argument(
         "--connection", required=True, help="Oracle connection string"
     )
+    parser_validate.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Run multiple operations in order, skipping the rest after a failure",
+    )
     parser_validate.add_argument(
         "--sql-client", choices=["sqlcl", "sqlplus"], help="Force specific SQL client"
     )
@@ -370,8 +447,11 @@ Examples:
     parser_validate.add_argument(
         "--verbose", action="store_true", help="Enable verbose output"
     )
+    parser_validate.set_defaults(func=cmd_validate)
+
 
-    # migrate subcommand
+def _add_migrate_parser(subparsers):
+    """Add the migrate subcommand"""
     parser_migrate = subparsers.add_parser("migrate", help="Migration execution")
     parser_migrate.add_argument(
         "mode", choices=["generate", "execute", "auto"], help="Migration mode"
@@ -387,8 +467,11 @@ Examples:
     parser_migrate.add_argument(
         "--thin-ldap", action="store_true", help="Enable thin client LDAP mode"
     )
+    parser_migrate.set_defaults(func=cmd_migrate)
+
 
-    # discover subcommand
+def _add_discover_parser(subparsers):
+    """Add the discover subcommand"""
     parser_discover = subparsers.add_parser("discover", help="Schema discovery")
     parser_discover.add_argument(
         "--schema", required=True, help="Schema name to discover"
@@ -399,8 +482,11 @@ Examples:
     parser_discover.add_argument(
         "--output-dir", help="Output directory for discovery results"
     )
+    parser_discover.set_defaults(func=cmd_discover)
 
-    # generate subcommand
+
+def _add_generate_parser(subparsers):
+    """Add the generate subcommand"""
     parser_generate = subparsers.add_parser("generate", help="DDL generation")
     parser_generate.add_argument(
         "--config", required=True, help="Path to migration config JSON"
@@ -408,8 +494,11 @@ Examples:
     parser_generate.add_argument(
         "--output-dir", help="Output directory for generated DDL"
     )
-    
-    # workflow subcommand
+    parser_generate.set_defaults(func=cmd_generate)
+
+
+def _add_workflow_parser(subparsers):
+    """Add the workflow subcommand"""
     parser_workflow = subparsers.add_parser("workflow", help="E2E workflow: discover -> generate")
     parser_workflow.add_argument(
         "--schema", required=True, help="Schema name to discover"
@@ -423,8 +512,11 @@ Examples:
     parser_workflow.add_argument(
         "--no-pause", action="store_true", help="Skip interactive pauses between steps (default: pauses enabled)"
     )
-    
-    # deploy subcommand
+    parser_workflow.set_defaults(func=cmd_workflow)
+
+
+def _add_deploy_parser(subparsers):
+    """Add the deploy subcommand"""
     parser_deploy = subparsers.add_parser("deploy", help="Deploy DDL to database")
     parser_deploy.add_argument(
         "--script", required=True, help="Path to SQL script to execute"
@@ -441,8 +533,11 @@ Examples:
     parser_deploy.add_argument(
         "--verbose", action="store_true", help="Enable verbose output"
     )
+    parser_deploy.set_defaults(func=cmd_deploy)
+
 
-    # setup subcommand
+def _add_setup_parser(subparsers):
+    """Add the setup subcommand"""
     parser_setup = subparsers.add_parser("setup", help="Setup test environment")
     parser_setup.add_argument(
         "--connection", required=True, help="Oracle connection string"
@@ -456,26 +551,86 @@ Examples:
     parser_setup.add_argument(
         "--verbose", action="store_true", help="Enable verbose output"
     )
+    parser_setup.set_defaults(func=cmd_setup)
+
+
+# Subcommand name -> function adding its subparser
+SUBPARSER_BUILDERS = {
+    "test": _add_test_parser,
+    "validate": _add_validate_parser,
+    "migrate": _add_migrate_parser,
+    "discover": _add_discover_parser,
+    "generate": _add_generate_parser,
+    "workflow": _add_workflow_parser,
+    "deploy": _add_deploy_parser,
+    "setup": _add_setup_parser,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI parser (cached, so repeated main() calls reuse it)
+
+    Args:
+        command: Subcommand about to be parsed (a SUBPARSER_BUILDERS key);
+            only its subparser is built
+    """
+    parser = argparse.ArgumentParser(
+        description="Unified Oracle Migration Runner",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Complete E2E workflow (discover + generate with interactive pauses)
+  python3 src/runner.py workflow --schema APP_DATA_OWNER --connection "$ORACLE_CONN"
+
+  # Deploy generated DDL to database
+  python3 src/runner.py deploy --script output/202*/APP_DATA_OWNER_TABLE/master1.sql --connection "$ORACLE_CONN"
+
+  # Individual steps
+  python3 src/runner.py discover --schema APP_DATA_OWNER --connection "$ORACLE_CONN"
+  python3 src/runner.py generate --config output/202*/migration_config.json
+  python3 src/runner.py validate check_existence APP_OWNER MY_TABLE --connection "$ORACLE_CONN"
+  python3 src/runner.py validate check_existence,count_rows,check_constraints APP_OWNER MY_TABLE --connection "$ORACLE_CONN"
+  python3 src/runner.py validate all APP_OWNER MY_TABLE --connection "$ORACLE_CONN"
+
+  # Full E2E test
+  python3 src/runner.py test --connection "$ORACLE_CONN" --schema APP_DATA_OWNER
+        """,
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+
+    # Only build the requested subcommand; --help, no command or a typo
+    # (command=None) builds all of them so the full usage and choices are listed
+    if command is not None:
+        SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for add_parser in SUBPARSER_BUILDERS.values():
+            add_parser(subparsers)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Main entry point
 
-    args = parser.parse_args()
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    command = argv[0] if argv and argv[0] in SUBPARSER_BUILDERS else None
+    parser = _build_parser(command)
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         return 1
 
     try:
-        command_map = {
-            "test": cmd_test,
-            "validate": cmd_validate,
-            "migrate": cmd_migrate,
-            "discover": cmd_discover,
-            "generate": cmd_generate,
-            "workflow": cmd_workflow,
-            "deploy": cmd_deploy,
-            "setup": cmd_setup,
-        }
-
-        return command_map[args.command](args)
+        return args.func(args)
 
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
@@ -17,21 +17,220 @@ Features:
 - Updates only when schema changes (idempotent)
 """
 
+import functools
+import hashlib
 import json
+import os
+import re
+import sys
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lib.json_loader import loads as load_json  # noqa: E402
+
+# Header line recording the digest the output was generated from
+_SCHEMA_HASH_PREFIX = "# schema-sha256: "
+# Bytes at the top of an existing output searched for that header
+_SCHEMA_HASH_SCAN_BYTES = 4096
+
+# Imports every generated module needs: the class decorator and type hints,
+# plus dataclasses, Enum and sys for the shared helpers. Per-class imports
+# only record anything beyond these.
+_BASE_IMPORTS: FrozenSet[str] = frozenset(
+    {
+        "from dataclasses import dataclass, field",
+        "from typing import List, Optional, Dict, Any",
+        "from enum import Enum",
+        "import dataclasses",
+        "import sys",
+    }
+)
+
+# Shared result for types that need no imports or dependencies
+_EMPTY: FrozenSet[str] = frozenset()
+
+# Special case mappings for enum names
+_SPECIAL_CASES: Mapping[str, str] = MappingProxyType(
+    {
+        "partitiontype": "PartitionType",
+        "intervaltype": "IntervalType",
+        "subpartitiontype": "SubpartitionType",
+        "migrationaction": "MigrationAction",
+        "yesno": "YesNo",
+    }
+)
+
+# Enum name patterns in order of specificity. Each branch is a lookahead from
+# the start of the string, so an earlier pattern wins wherever it occurs and
+# match.lastindex identifies it in _ENUM_NAMES.
+_ENUM_NAME_RE = re.compile(
+    r"(?=.*(partition_type|partitiontype))"
+    r"|(?=.*(interval_type|intervaltype))"
+    r"|(?=.*(subpartition_type|subpartitiontype))"
+    r"|(?=.*(migration_action|migrationaction))"
+    r"|(?=.*(priority))"
+    r"|(?=.*(nullable|yesno|yes|no))",
+    re.DOTALL,
+)
+_ENUM_NAMES = (
+    "PartitionTypeEnum",
+    "IntervalTypeEnum",
+    "SubpartitionTypeEnum",
+    "MigrationActionEnum",
+    "PriorityEnum",
+    "YesNoEnum",
+)
+
+# Definition names whose PascalCase form cannot be derived mechanically
+_CLASS_NAME_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        # Schema definition names (already PascalCase)
+        "tableconfig": "TableConfig",
+        "connectiondetails": "ConnectionDetails",
+        "environmentconfig": "EnvironmentConfig",
+        "currentstate": "CurrentState",
+        "commonsettings": "CommonSettings",
+        "targetconfiguration": "TargetConfiguration",
+        "migrationsettings": "MigrationSettings",
+        "columninfo": "ColumnInfo",
+        "lobstorageinfo": "LobStorageInfo",
+        "storageparameters": "StorageParameters",
+        "indexinfo": "IndexInfo",
+        "grantinfo": "GrantInfo",
+        "availablecolumns": "AvailableColumns",
+        "datatablespaces": "DataTablespaces",
+        "tablespaceconfig": "TablespaceConfig",
+        "subpartitiondefaults": "SubpartitionDefaults",
+        "sizerecommendation": "SizeRecommendation",
+        "paralleldefaults": "ParallelDefaults",
+        # Snake case versions
+        "connection_details": "ConnectionDetails",
+        "environment_config": "EnvironmentConfig",
+        "table_config": "TableConfig",
+        "current_state": "CurrentState",
+        "common_settings": "CommonSettings",
+        "target_configuration": "TargetConfiguration",
+        "migration_settings": "MigrationSettings",
+        "column_info": "ColumnInfo",
+        "lob_storage_info": "LobStorageInfo",
+        "storage_parameters": "StorageParameters",
+        "index_info": "IndexInfo",
+        "grant_info": "GrantInfo",
+        "available_columns": "AvailableColumns",
+        "data_tablespaces": "DataTablespaces",
+        "tablespace_config": "TablespaceConfig",
+        "subpartition_defaults": "SubpartitionDefaults",
+        "size_recommendation": "SizeRecommendation",
+        "parallel_defaults": "ParallelDefaults",
+    }
+)
+
+# from_dict() argument line per field kind
+_FROM_DICT_TEMPLATES: Dict[str, str] = {
+    "enum_optional": '            {name}={etype}(data["{name}"]) if "{name}" in data and data["{name}"] is not None else {default},',
+    "enum": '            {name}={etype}(data["{name}"]) if "{name}" in data else {default},',
+    "enum_list": '            {name}=[{etype}(x) for x in data.get("{name}", [])],',
+    "class_list": '            {name}=[{etype}.from_dict(x) for x in data.get("{name}", [])],',
+    "list": '            {name}=data.get("{name}", []),',
+    "class_optional": '            {name}={etype}.from_dict(data["{name}"]) if "{name}" in data and data["{name}"] is not None else None,',
+    "class": '            {name}={etype}.from_dict(data["{name}"]) if "{name}" in data else None,',
+    "default": '            {name}=data.get("{name}", {default}),',
+    # Booleans should default to False if not present
+    "bool": '            {name}=data.get("{name}", False),',
+    "optional": '            {name}=data.get("{name}"),',
+    "required": '            {name}=data["{name}"],',
+}
+
+# Start of every generated from_dict(); the per-field argument lines follow
+_FROM_DICT_HEADER = (
+    "    @classmethod\n"
+    '    def from_dict(cls, data: Dict[str, Any]) -> "{class_name}":\n'
+    '        """Create instance from dictionary with proper type conversions"""\n'
+    "        if data is None:\n"
+    "            return None\n"
+    "        return cls("
+)
+
+# Field types whose values serialize as-is, so to_dict() skips _convert()
+_PLAIN_TYPES: FrozenSet[str] = frozenset(
+    {
+        "str",
+        "int",
+        "float",
+        "bool",
+        "Optional[str]",
+        "Optional[int]",
+        "Optional[float]",
+        "Optional[bool]",
+    }
+)
+
+# Tail of ColumnInfo's to_dict(): drop identity fields for plain columns
+_COLUMN_INFO_IDENTITY_STRIP = (
+    "        if hasattr(self, 'is_identity') and not self.is_identity:",
+    "            identity_fields = [",
+    "                'identity_generation', 'identity_sequence', 'identity_start_with',",
+    "                'identity_increment_by', 'identity_max_value', 'identity_min_value',",
+    "                'identity_cache_size', 'identity_cycle_flag', 'identity_order_flag'",
+    "            ]",
+    "            for field in identity_fields:",
+    "                result.pop(field, None)",
+)
+
+# Generated dataclasses are slotted (no per-instance __dict__) where the
+# running Python supports it
+_DATACLASS_OPTIONS_LINES = (
+    "# Slotted dataclasses (no per-instance __dict__) on Python 3.10+",
+    '_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}',
+    "",
+)
+
+# Module-level helper shared by every generated to_dict() for values whose
+# conversion is not known statically (enums may hold raw strings)
+_CONVERT_HELPER = [
+    "def _convert(val):",
+    '    """Recursively convert enums and nested dataclasses for JSON"""',
+    "    if isinstance(val, Enum):",
+    "        return val.value",
+    "    elif dataclasses.is_dataclass(val):",
+    "        return val.to_dict()",
+    "    elif isinstance(val, list):",
+    "        return [_convert(v) for v in val]",
+    "    elif isinstance(val, dict):",
+    "        return {k: _convert(v) for k, v in val.items()}",
+    "    else:",
+    "        return val",
+    "",
+]
+
+
+@dataclass(frozen=True)
+class GeneratedClass:
+    """Information about a generated class"""
+
+    name: str
+    content: bytes  # UTF-8 source, written to the output file as-is
+    imports: FrozenSet[str]  # Imports beyond _BASE_IMPORTS
+    dependencies: FrozenSet[str]  # Other classes this depends on
 
 
 @dataclass
-class GeneratedClass:
-    """Information about a generated class"""
+class FieldSpec:
+    """Classification of one field, shared by the code generation passes"""
 
     name: str
-    content: str
-    imports: Set[str]
-    dependencies: Set[str]  # Other classes this depends on
+    py_type: str
+    kind: str  # Key into _FROM_DICT_TEMPLATES
+    etype: str  # Enum / nested class / list item type used by the template
+    is_optional: bool
+    default_literal: str  # Schema default rendered as Python source
 
 
 class SchemaToDataclassGenerator:
@@ -43,14 +242,34 @@ class SchemaToDataclassGenerator:
         self.schema: Dict = {}
         self.generated_classes: List[GeneratedClass] = []
         self.enums: Dict[str, List[str]] = {}
+        # _get_python_type results keyed by canonical JSON of the field definition
+        self._type_cache: Dict[str, Tuple[str, FrozenSet[str], FrozenSet[str]]] = {}
+        self.schema_sha256 = ""
 
     def generate(self) -> None:
         """Main generation method"""
         print(f"🔄 Generating dataclasses from {self.schema_file}")
 
         # Load schema
-        with open(self.schema_file, "r") as f:
-            self.schema = json.load(f)
+        schema_bytes = self.schema_file.read_bytes()
+
+        # Skip regeneration when the output was built from this exact schema.
+        # The generator's own source is hashed too, so changes here still
+        # produce a fresh output.
+        digest = hashlib.sha256(schema_bytes)
+        digest.update(Path(__file__).read_bytes())
+        self.schema_sha256 = digest.hexdigest()
+        if self._output_is_current():
+            print(f"✅ {self.output_file} is up to date")
+            return
+
+        self.schema = load_json(schema_bytes)
+
+        # Start from a clean slate so a second generate() neither duplicates
+        # classes nor reuses types resolved against the previous enums
+        self.generated_classes = []
+        self.enums = {}
+        self._type_cache.clear()
 
         # Extract enums first (prioritize definitions)
         self._extract_enums()
@@ -72,10 +291,20 @@ class SchemaToDataclassGenerator:
             f"✅ Generated {len(self.generated_classes)} classes in {self.output_file}"
         )
 
+    def _output_is_current(self) -> bool:
+        """Check whether the existing output records the current schema digest"""
+        if not self.output_file.is_file():
+            return False
+
+        # Raw prefix read: no decoding or line splitting of the old module
+        expected = f"\n{_SCHEMA_HASH_PREFIX}{self.schema_sha256}\n".encode("ascii")
+        with open(self.output_file, "rb") as f:
+            return expected in f.read(_SCHEMA_HASH_SCAN_BYTES)
+
     def _extract_enums(self) -> None:
         """Extract all enum definitions from schema - prioritize definitions section"""
         # Use a set to track enum values and avoid duplicates
-        enum_signatures = set()
+        enum_signatures: Set[FrozenSet[str]] = set()
 
         # FIRST: Process definitions section (these have correct names)
         if "definitions" in self.schema:
@@ -83,7 +312,7 @@ class SchemaToDataclassGenerator:
                 if definition.get("type") == "string" and "enum" in definition:
                     valid_enum_values = [v for v in definition["enum"] if v is not None]
                     if valid_enum_values:
-                        enum_values = tuple(sorted(valid_enum_values))
+                        enum_values = frozenset(valid_enum_values)
                         enum_name = self._to_class_name(name)
 
                         # Always add from definitions (they have priority)
@@ -91,26 +320,38 @@ class SchemaToDataclassGenerator:
                         enum_signatures.add(enum_values)
 
         # SECOND: Find other enums in schema (skip if already found)
-        def find_enums(obj, path="", parent_key=""):
+        # Iterative pre-order walk; paths are kept as segment tuples and only
+        # joined into a string when an enum is actually found. Only dicts and
+        # lists are ever on the stack.
+        stack = deque([(self.schema, (), "")])
+        while stack:
+            obj, segments, parent_key = stack.pop()
             if isinstance(obj, dict):
                 if "enum" in obj:
-                    # Filter out None values and sort for signature
+                    # Filter out None values; the value set is the signature
                     valid_enum_values = [v for v in obj["enum"] if v is not None]
                     if valid_enum_values:  # Only process if we have valid enum values
-                        enum_values = tuple(sorted(valid_enum_values))
+                        enum_values = frozenset(valid_enum_values)
                         if enum_values not in enum_signatures:
+                            path = "".join(segments).lstrip(".")
                             enum_name = self._guess_enum_name(
                                 path, obj.get("description", ""), parent_key
                             )
                             self.enums[enum_name] = valid_enum_values
                             enum_signatures.add(enum_values)
-                for key, value in obj.items():
-                    find_enums(value, f"{path}.{key}" if path else key, key)
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    find_enums(item, f"{path}[{i}]", parent_key)
-
-        find_enums(self.schema)
+                # Push in reverse so children are visited in document order;
+                # scalar leaves can never hold an enum and are not pushed
+                stack.extend(
+                    (value, segments + (f".{key}",), key)
+                    for key, value in reversed(obj.items())
+                    if isinstance(value, (dict, list))
+                )
+            else:
+                stack.extend(
+                    (item, segments + (f"[{i}]",), parent_key)
+                    for i, item in reversed(list(enumerate(obj)))
+                    if isinstance(item, (dict, list))
+                )
 
     def _guess_enum_name(
         self, path: str, description: str, parent_key: str = ""
@@ -120,39 +361,18 @@ class SchemaToDataclassGenerator:
         combined = f"{path} {description} {parent_key}".lower()
 
         # Look for specific patterns in order of specificity
-        if any(pattern in combined for pattern in ["partition_type", "partitiontype"]):
-            return "PartitionTypeEnum"
-        elif any(pattern in combined for pattern in ["interval_type", "intervaltype"]):
-            return "IntervalTypeEnum"
-        elif any(
-            pattern in combined for pattern in ["subpartition_type", "subpartitiontype"]
-        ):
-            return "SubpartitionTypeEnum"
-        elif any(
-            pattern in combined for pattern in ["migration_action", "migrationaction"]
-        ):
-            return "MigrationActionEnum"
-        elif "priority" in combined:
-            return "PriorityEnum"
-        elif any(pattern in combined for pattern in ["nullable", "yesno", "yes", "no"]):
-            return "YesNoEnum"
-        else:
-            # Generate from the most specific available key
-            key_to_use = parent_key or path.split(".")[-1] if path else "Unknown"
-            # Apply proper PascalCase conversion
-            if key_to_use.lower() in self._get_special_cases():
-                return self._get_special_cases()[key_to_use.lower()] + "Enum"
-            return self._to_class_name(key_to_use) + "Enum"
-
-    def _get_special_cases(self) -> Dict[str, str]:
-        """Get special case mappings for enum names"""
-        return {
-            "partitiontype": "PartitionType",
-            "intervaltype": "IntervalType",
-            "subpartitiontype": "SubpartitionType",
-            "migrationaction": "MigrationAction",
-            "yesno": "YesNo",
-        }
+        match = _ENUM_NAME_RE.match(combined)
+        if match:
+            return _ENUM_NAMES[match.lastindex - 1]
+
+        # Generate from the most specific available key
+        key_to_use = parent_key or path.split(".")[-1] if path else "Unknown"
+        # Apply proper PascalCase conversion. Built names are interned so
+        # every enum table, type and dependency set shares one string object
+        special = _SPECIAL_CASES.get(key_to_use.lower())
+        if special:
+            return sys.intern(special + "Enum")
+        return sys.intern(self._to_class_name(key_to_use) + "Enum")
 
     def _generate_root_class(self, class_name: str, definition: Dict) -> None:
         """Generate the root MigrationConfig class with exact name"""
@@ -166,17 +386,13 @@ class SchemaToDataclassGenerator:
 
     def _generate_dataclass(self, class_name: str, definition: Dict) -> None:
         """Generate a dataclass with the given exact class name"""
-        imports = {
-            "from dataclasses import dataclass, field",
-            "from typing import List, Optional, Dict, Any",
-            "from enum import Enum",
-        }
-
+        # Only imports beyond _BASE_IMPORTS are collected per class
+        imports = set()
         dependencies = set()
 
         # Generate class header
-        content = f"@dataclass\nclass {class_name}:\n"
-        content += f'    """{definition.get("description", f"{class_name} configuration")}"""\n'
+        lines = ["@dataclass(**_DATACLASS_OPTIONS)", f"class {class_name}:"]
+        lines.append(f'    """{definition.get("description", f"{class_name} configuration")}"""')
 
         # Generate fields - required fields first, then optional fields
         properties = definition.get("properties", {})
@@ -185,11 +401,19 @@ class SchemaToDataclassGenerator:
         # Split into required and optional fields
         required_fields = []
         optional_fields = []
+        # (name, type) in declaration order, for the to_dict() pass below
+        required_names = []
+        optional_names = []
+        # Resolved types, reused by the from_dict pass below
+        field_types = []
 
         for field_name, field_def in properties.items():
             field_type, field_imports, field_deps = self._get_python_type(field_def)
-            imports.update(field_imports)
-            dependencies.update(field_deps)
+            field_types.append((field_name, field_def, field_type))
+            if field_imports:
+                imports.update(field_imports)
+            if field_deps:
+                dependencies.update(field_deps)
 
             is_required = field_name in required
             # Check if field has a default value in schema or should be treated as optional
@@ -209,123 +433,132 @@ class SchemaToDataclassGenerator:
             # A field is truly required only if it's in required list AND has no default
             if is_required and not has_schema_default:
                 required_fields.append(field_line)
+                required_names.append((field_name, field_type))
             else:
                 optional_fields.append(field_line)
+                optional_names.append((field_name, field_type))
 
         # Combine required fields first, then optional fields
         fields = required_fields + optional_fields
 
-        # Build field definitions dict for serialization
-        field_definitions = {}
-        for field_name, field_def in properties.items():
-            field_definitions[field_name] = field_def
-
-        content += "\n".join(fields)
-
-        # Add serialization methods - use explicit field-by-field approach per Principal Engineer guidance
-        content += "\n\n    def to_dict(self) -> Dict[str, Any]:\n"
-        content += '        """Convert to dictionary for JSON serialization - explicit recursive conversion"""\n'
-        content += "        import dataclasses\n"
-        content += "        def convert(val):\n"
-        content += "            if isinstance(val, Enum):\n"
-        content += "                return val.value\n"
-        content += "            elif dataclasses.is_dataclass(val):\n"
-        content += "                return val.to_dict()\n"
-        content += "            elif isinstance(val, list):\n"
-        content += "                return [convert(v) for v in val]\n"
-        content += "            elif isinstance(val, dict):\n"
-        content += "                return {k: convert(v) for k, v in val.items()}\n"
-        content += "            else:\n"
-        content += "                return val\n"
-        content += "        result = {f.name: convert(getattr(self, f.name)) for f in self.__dataclass_fields__.values()}\n"
-
-        # For ColumnInfo, remove identity fields if not an identity column
-        if class_name == "ColumnInfo":
-            content += "        # Remove identity-specific fields if this is not an identity column\n"
-            content += "        if hasattr(self, 'is_identity') and not self.is_identity:\n"
-            content += "            identity_fields = [\n"
-            content += "                'identity_generation', 'identity_sequence', 'identity_start_with',\n"
-            content += "                'identity_increment_by', 'identity_max_value', 'identity_min_value',\n"
-            content += "                'identity_cache_size', 'identity_cycle_flag', 'identity_order_flag'\n"
-            content += "            ]\n"
-            content += "            for field in identity_fields:\n"
-            content += "                result.pop(field, None)\n"
-
-        content += "        return result\n"
-
-        content += "    @classmethod\n"
-        content += f'    def from_dict(cls, data: Dict[str, Any]) -> "{class_name}":\n'
-        content += '        """Create instance from dictionary with proper type conversions"""\n'
-        content += "        if data is None:\n"
-        content += "            return None\n"
-        content += "        return cls(\n"
+        lines.extend(fields)
+
+        # to_dict() is unrolled per field in declaration order: plain values
+        # are copied directly, anything else goes through _convert()
+        is_column_info = class_name == "ColumnInfo"
+        lines.append("")
+        lines.append("    def to_dict(self) -> Dict[str, Any]:")
+        lines.append('        """Convert to dictionary for JSON serialization - explicit per-field conversion"""')
+        lines.append("        result = {" if is_column_info else "        return {")
+        lines.extend(
+            f'            "{name}": self.{name},'
+            if field_type in _PLAIN_TYPES
+            else f'            "{name}": _convert(self.{name}),'
+            for name, field_type in required_names + optional_names
+        )
+        lines.append("        }")
+        if is_column_info:
+            # Drop identity fields when the column is not an identity column
+            lines.extend(_COLUMN_INFO_IDENTITY_STRIP)
+            lines.append("        return result")
+        lines.append("")
+
+        lines.append(_FROM_DICT_HEADER.format(class_name=class_name))
 
         # Generate explicit field-by-field conversion per Principal Engineer guidance
-        for field_name, field_def in properties.items():
-            field_type, field_imports, field_deps = self._get_python_type(field_def)
-            is_optional = "Optional" in field_type or field_name not in required
-            schema_default = field_def.get("default")
-            default_value = self._format_default_for_from_dict(schema_default)
-
-            # Determine conversion logic based on type
-            if "Enum" in field_type:
-                enum_name = field_type.split("[")[0].strip()
-                if is_optional:
-                    content += f'            {field_name}={enum_name}(data["{field_name}"]) if "{field_name}" in data and data["{field_name}"] is not None else {default_value},\n'
-                else:
-                    content += f'            {field_name}={enum_name}(data["{field_name}"]) if "{field_name}" in data else {default_value},\n'
-            elif "List[" in field_type:
-                # Extract inner type from List[InnerType]
-                inner_type = field_type.split("[")[1].split("]")[0]
-                if inner_type in self.enums or "Enum" in inner_type:
-                    # List of enums
-                    content += f'            {field_name}=[{inner_type}(x) for x in data.get("{field_name}", [])],\n'
-                elif inner_type in dependencies:
-                    # List of dataclasses
-                    content += f'            {field_name}=[{inner_type}.from_dict(x) for x in data.get("{field_name}", [])],\n'
-                else:
-                    # Primitive list
-                    content += f'            {field_name}=data.get("{field_name}", []),\n'
-            elif field_type in dependencies:
-                # Nested dataclass
-                if is_optional:
-                    content += f'            {field_name}={field_type}.from_dict(data["{field_name}"]) if "{field_name}" in data and data["{field_name}"] is not None else None,\n'
-                else:
-                    content += f'            {field_name}={field_type}.from_dict(data["{field_name}"]) if "{field_name}" in data else None,\n'
-            else:
-                # Primitive type - use schema default if available
-                if schema_default is not None:
-                    content += f'            {field_name}=data.get("{field_name}", {default_value}),\n'
-                elif field_type == "bool":
-                    # Booleans should default to False if not present
-                    content += f'            {field_name}=data.get("{field_name}", False),\n'
-                elif is_optional:
-                    content += f'            {field_name}=data.get("{field_name}"),\n'
-                else:
-                    content += f'            {field_name}=data["{field_name}"],\n'
-
-        content += "        )\n"
+        specs = [
+            self._field_spec(field_name, field_def, field_type, required, dependencies)
+            for field_name, field_def, field_type in field_types
+        ]
+        lines.extend(
+            _FROM_DICT_TEMPLATES[spec.kind].format(
+                name=spec.name, etype=spec.etype, default=spec.default_literal
+            )
+            for spec in specs
+        )
+
+        # Trailing "" yields the final newline from the single join, without
+        # copying the whole body again for a "+ \n"
+        lines.append("        )")
+        lines.append("")
+        content = "\n".join(lines)
 
         self.generated_classes.append(
             GeneratedClass(
                 name=class_name,
-                content=content,
-                imports=imports,
-                dependencies=dependencies,
+                content=content.encode("utf-8"),
+                imports=frozenset(imports) if imports else _EMPTY,
+                dependencies=frozenset(dependencies),
             )
         )
 
-    def _get_python_type(self, field_def: Dict) -> tuple[str, Set[str], Set[str]]:
-        """Convert JSON Schema type to Python type"""
-        imports = set()
-        dependencies = set()
+    def _field_spec(
+        self,
+        field_name: str,
+        field_def: Dict,
+        field_type: str,
+        required: Set[str],
+        dependencies: Set[str],
+    ) -> FieldSpec:
+        """Classify a field (with its already resolved type) for from_dict"""
+        is_optional = "Optional" in field_type or field_name not in required
+        schema_default = field_def.get("default")
+        etype = field_type
+
+        # Determine conversion logic based on type
+        if "Enum" in field_type:
+            etype = field_type.split("[")[0].strip()
+            kind = "enum_optional" if is_optional else "enum"
+        elif "List[" in field_type:
+            # Extract inner type from List[InnerType]
+            etype = field_type.split("[")[1].split("]")[0]
+            if etype in self.enums or "Enum" in etype:
+                kind = "enum_list"
+            elif etype in dependencies:
+                kind = "class_list"
+            else:
+                kind = "list"
+        elif field_type in dependencies:
+            kind = "class_optional" if is_optional else "class"
+        elif schema_default is not None:
+            kind = "default"
+        elif field_type == "bool":
+            kind = "bool"
+        else:
+            kind = "optional" if is_optional else "required"
+
+        return FieldSpec(
+            name=field_name,
+            py_type=field_type,
+            kind=kind,
+            etype=etype,
+            is_optional=is_optional,
+            default_literal=self._format_default_for_from_dict(schema_default),
+        )
+
+    def _get_python_type(
+        self, field_def: Dict
+    ) -> Tuple[str, FrozenSet[str], FrozenSet[str]]:
+        """Convert JSON Schema type to Python type (memoized per field shape)"""
+        # $ref resolution is a cached name conversion; skip the key encoding
+        if "$ref" in field_def:
+            return self._compute_python_type(field_def)
 
+        key = json.dumps(field_def, sort_keys=True)
+        cached = self._type_cache.get(key)
+        if cached is None:
+            cached = self._type_cache[key] = self._compute_python_type(field_def)
+        return cached
+
+    def _compute_python_type(
+        self, field_def: Dict
+    ) -> Tuple[str, FrozenSet[str], FrozenSet[str]]:
+        """Convert JSON Schema type to Python type"""
         # Handle $ref first
         if "$ref" in field_def:
             ref_name = field_def["$ref"].split("/")[-1]
             class_name = self._to_class_name(ref_name)
-            dependencies.add(class_name)
-            return class_name, imports, dependencies
+            return class_name, _EMPTY, frozenset((class_name,))
 
         field_type = field_def.get("type")
 
@@ -340,11 +573,11 @@ class SchemaToDataclassGenerator:
                             **{k: v for k, v in field_def.items() if k != "type"},
                         }
                     )
-                    imports.update(base_imports)
-                    dependencies.update(base_deps)
-                    return f"Optional[{base_type}]", imports, dependencies
-            # For complex unions, use Union
+                    return f"Optional[{base_type}]", base_imports, base_deps
+            # For complex unions, use Union (not part of the base imports)
             union_types = []
+            imports = {"from typing import Union"}
+            dependencies = set()
             for t in field_type:
                 if t != "null":
                     sub_type, sub_imports, sub_deps = self._get_python_type({"type": t})
@@ -354,41 +587,42 @@ class SchemaToDataclassGenerator:
             if "null" in field_type:
                 return (
                     f'Optional[Union[{", ".join(union_types)}]]',
-                    imports,
-                    dependencies,
+                    frozenset(imports),
+                    frozenset(dependencies),
                 )
             else:
-                return f'Union[{", ".join(union_types)}]', imports, dependencies
+                return (
+                    f'Union[{", ".join(union_types)}]',
+                    frozenset(imports),
+                    frozenset(dependencies),
+                )
 
         if field_type == "string":
             if "enum" in field_def:
                 enum_name = self._guess_enum_name("", field_def.get("description", ""))
                 if enum_name in self.enums:
-                    dependencies.add(enum_name)
-                    return enum_name, imports, dependencies
-            return "str", imports, dependencies
+                    return enum_name, _EMPTY, frozenset((enum_name,))
+            return "str", _EMPTY, _EMPTY
 
         elif field_type == "integer":
-            return "int", imports, dependencies
+            return "int", _EMPTY, _EMPTY
 
         elif field_type == "number":
-            return "float", imports, dependencies
+            return "float", _EMPTY, _EMPTY
 
         elif field_type == "boolean":
-            return "bool", imports, dependencies
+            return "bool", _EMPTY, _EMPTY
 
         elif field_type == "array":
             items_def = field_def.get("items", {})
             items_type, items_imports, items_deps = self._get_python_type(items_def)
-            imports.update(items_imports)
-            dependencies.update(items_deps)
-            return f"List[{items_type}]", imports, dependencies
+            return f"List[{items_type}]", items_imports, items_deps
 
         elif field_type == "object":
-            return "Dict[str, Any]", imports, dependencies
+            return "Dict[str, Any]", _EMPTY, _EMPTY
 
         else:
-            return "Any", imports, dependencies
+            return "Any", _EMPTY, _EMPTY
 
     def _get_default_value(self, field_def: Dict, is_required: bool) -> Optional[str]:
         """Get default value for a field"""
@@ -413,52 +647,14 @@ class SchemaToDataclassGenerator:
             return f'"{default_value}"'
         return "None"
 
-    def _to_class_name(self, name: str) -> str:
-        """Convert snake_case to PascalCase"""
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _to_class_name(name: str) -> str:
+        """Convert snake_case to PascalCase (cached; names repeat across the schema)"""
         # Handle special cases for proper capitalization
-        special_cases = {
-            # Schema definition names (already PascalCase)
-            "tableconfig": "TableConfig",
-            "connectiondetails": "ConnectionDetails",
-            "environmentconfig": "EnvironmentConfig",
-            "currentstate": "CurrentState",
-            "commonsettings": "CommonSettings",
-            "targetconfiguration": "TargetConfiguration",
-            "migrationsettings": "MigrationSettings",
-            "columninfo": "ColumnInfo",
-            "lobstorageinfo": "LobStorageInfo",
-            "storageparameters": "StorageParameters",
-            "indexinfo": "IndexInfo",
-            "grantinfo": "GrantInfo",
-            "availablecolumns": "AvailableColumns",
-            "datatablespaces": "DataTablespaces",
-            "tablespaceconfig": "TablespaceConfig",
-            "subpartitiondefaults": "SubpartitionDefaults",
-            "sizerecommendation": "SizeRecommendation",
-            "paralleldefaults": "ParallelDefaults",
-            # Snake case versions
-            "connection_details": "ConnectionDetails",
-            "environment_config": "EnvironmentConfig",
-            "table_config": "TableConfig",
-            "current_state": "CurrentState",
-            "common_settings": "CommonSettings",
-            "target_configuration": "TargetConfiguration",
-            "migration_settings": "MigrationSettings",
-            "column_info": "ColumnInfo",
-            "lob_storage_info": "LobStorageInfo",
-            "storage_parameters": "StorageParameters",
-            "index_info": "IndexInfo",
-            "grant_info": "GrantInfo",
-            "available_columns": "AvailableColumns",
-            "data_tablespaces": "DataTablespaces",
-            "tablespace_config": "TablespaceConfig",
-            "subpartition_defaults": "SubpartitionDefaults",
-            "size_recommendation": "SizeRecommendation",
-            "parallel_defaults": "ParallelDefaults",
-        }
-
-        if name.lower() in special_cases:
-            return special_cases[name.lower()]
+        special = _CLASS_NAME_MAP.get(name.lower())
+        if special:
+            return special
 
         # Handle snake_case input
         if "_" in name:
@@ -471,65 +667,110 @@ class SchemaToDataclassGenerator:
         # Handle lowercase input - capitalize first letter
         return name.capitalize() if name else name
 
-    def _write_output(self) -> None:
-        """Write generated classes to output file"""
-        content = ["#!/usr/bin/env python3"]
-        content.append('"""')
-        content.append("Generated Migration Models")
-        content.append("=" * 25)
-        content.append("Auto-generated from enhanced_migration_schema.json")
-        content.append("DO NOT EDIT MANUALLY - Run: python3 src/schema_to_dataclass.py")
-        content.append("")
-        content.append(f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
-        content.append('"""')
-        content.append("")
-        content.append("from __future__ import annotations")
-        content.append("")
-
-        # Collect all imports
-        all_imports = set()
-        for cls in self.generated_classes:
-            all_imports.update(cls.imports)
-
-        # Add imports
-        for imp in sorted(all_imports):
-            content.append(imp)
-        content.append("")
-
-        # Add enums first
-        for enum_name, values in self.enums.items():
-            content.append(f"class {enum_name}(Enum):")
-            content.append(f'    """{enum_name} enumeration"""')
-            for value in values:
-                enum_key = value.upper().replace("-", "_").replace(" ", "_")
-                content.append(f'    {enum_key} = "{value}"')
-            content.append("")
-
-        # Add classes in dependency order
-        written = set()
-
-        def write_class(cls: GeneratedClass):
-            if cls.name in written:
-                return
-
-            # Write dependencies first
-            for dep in cls.dependencies:
-                dep_cls = next(
-                    (c for c in self.generated_classes if c.name == dep), None
-                )
-                if dep_cls:
-                    write_class(dep_cls)
-
-            content.append(cls.content)
-            content.append("")
-            written.add(cls.name)
+    def _dependency_order(self) -> List[GeneratedClass]:
+        """
+        Order generated classes so dependencies come first (Kahn's algorithm)
 
+        Ties keep generation order, so the output is stable across runs. Any
+        classes caught in a reference cycle are appended in generation order.
+        """
+        by_name: Dict[str, GeneratedClass] = {}
         for cls in self.generated_classes:
-            write_class(cls)
+            by_name.setdefault(cls.name, cls)
+
+        indegree = {name: 0 for name in by_name}
+        dependents: Dict[str, List[str]] = {name: [] for name in by_name}
+        for name, cls in by_name.items():
+            for dep in cls.dependencies:
+                if dep in by_name and dep != name:
+                    indegree[name] += 1
+                    dependents[dep].append(name)
+
+        ready = deque(name for name, count in indegree.items() if count == 0)
+        ordered = []
+        while ready:
+            name = ready.popleft()
+            ordered.append(by_name[name])
+            for dependent in dependents[name]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.append(dependent)
+
+        # Anything still waiting on a dependency is part of (or behind) a cycle;
+        # annotations are postponed, so the module still imports fine
+        cyclic = [name for name, count in indegree.items() if count]
+        if cyclic:
+            print(f"⚠️  Reference cycle, classes kept in generation order: {', '.join(cyclic)}")
+            ordered.extend(by_name[name] for name in cyclic)
+        return ordered
 
-        # Write to file
-        with open(self.output_file, "w") as f:
-            f.write("\n".join(content))
+    def _write_output(self) -> None:
+        """Write generated classes to output file"""
+        # Write to a sibling temp file and rename it over the output, so an
+        # interrupted run never leaves a truncated module behind
+        tmp_file = self.output_file.with_name(self.output_file.name + ".tmp")
+        try:
+            # Stream straight to the file instead of building the module in memory
+            with open(tmp_file, "wb", buffering=1 << 20) as f:
+                write = f.write
+
+                def emit(line: str) -> None:
+                    # Newline-separated, exactly as "\n".join() of the same lines
+                    write(b"\n")
+                    write(line.encode("utf-8"))
+
+                write(b"#!/usr/bin/env python3")
+                emit(f"{_SCHEMA_HASH_PREFIX}{self.schema_sha256}")
+                emit('"""')
+                emit("Generated Migration Models")
+                emit("=" * 25)
+                emit("Auto-generated from enhanced_migration_schema.json")
+                emit("DO NOT EDIT MANUALLY - Run: python3 src/schema_to_dataclass.py")
+                emit("")
+                emit(f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
+                emit('"""')
+                emit("")
+                emit("from __future__ import annotations")
+                emit("")
+
+                # Base imports once, plus whatever individual classes added
+                all_imports = set(_BASE_IMPORTS)
+                for cls in self.generated_classes:
+                    all_imports.update(cls.imports)
+
+                # Add imports
+                for imp in sorted(all_imports):
+                    emit(imp)
+                emit("")
+
+                # Dataclass options and the shared to_dict() value conversion,
+                # emitted once for all classes
+                for line in _DATACLASS_OPTIONS_LINES:
+                    emit(line)
+                for line in _CONVERT_HELPER:
+                    emit(line)
+                emit("")
+
+                # Add enums first
+                for enum_name, values in self.enums.items():
+                    emit(f"class {enum_name}(Enum):")
+                    emit(f'    """{enum_name} enumeration"""')
+                    for value in values:
+                        enum_key = value.upper().replace("-", "_").replace(" ", "_")
+                        emit(f'    {enum_key} = "{value}"')
+                    emit("")
+
+                # Add classes in dependency order
+                # Class bodies are already UTF-8; no encode pass over the bulk
+                for cls in self._dependency_order():
+                    write(b"\n")
+                    write(cls.content)
+                    emit("")
+
+            os.replace(tmp_file, self.output_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
 
 
 def main():
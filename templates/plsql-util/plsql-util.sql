@@ -1097,9 +1097,74 @@ BEGIN
                             v_result := FALSE;
                     END;
 
+                WHEN 'SWAP_FULL' THEN
+                    -- Pre-swap checks, rename swap and post-swap checks in one call
+                    -- Args: owner, table, new_table, old_table
+                    DECLARE
+                        v_owner VARCHAR2(128) := DBMS_ASSERT.SIMPLE_SQL_NAME(UPPER('&arg3'));
+                        v_table VARCHAR2(128) := DBMS_ASSERT.SIMPLE_SQL_NAME(UPPER('&arg4'));
+                        v_new_table VARCHAR2(128) := DBMS_ASSERT.SIMPLE_SQL_NAME(UPPER('&arg5'));
+                        v_old_table VARCHAR2(128) := DBMS_ASSERT.SIMPLE_SQL_NAME(UPPER('&arg6'));
+                        v_renamed BOOLEAN := FALSE;
+                    BEGIN
+                        DBMS_OUTPUT.PUT_LINE('Checking tables exist...');
+
+                        SELECT COUNT(*) INTO v_count FROM all_tables
+                        WHERE owner = v_owner AND table_name = v_table;
+                        IF v_count = 0 THEN
+                            DBMS_OUTPUT.PUT_LINE('  FAILED: Original table missing');
+                            v_result := FALSE;
+                        END IF;
+
+                        SELECT COUNT(*) INTO v_count FROM all_tables
+                        WHERE owner = v_owner AND table_name = v_new_table;
+                        IF v_count = 0 THEN
+                            DBMS_OUTPUT.PUT_LINE('  FAILED: New table missing');
+                            v_result := FALSE;
+                        END IF;
+
+                        IF NOT v_result THEN
+                            DBMS_OUTPUT.PUT_LINE('PRE_SWAP: FAILED');
+                            DBMS_OUTPUT.PUT_LINE('RESULT: FAILED - Pre-swap checks failed, swap not attempted');
+                        ELSE
+                            DBMS_OUTPUT.PUT_LINE('PRE_SWAP: PASSED');
+
+                            BEGIN
+                                EXECUTE IMMEDIATE 'ALTER TABLE ' || v_owner || '.' || v_table || ' RENAME TO ' || v_old_table;
+                                v_renamed := TRUE;
+                                EXECUTE IMMEDIATE 'ALTER TABLE ' || v_owner || '.' || v_new_table || ' RENAME TO ' || v_table;
+                                DBMS_OUTPUT.PUT_LINE('SWAP: PASSED');
+                            EXCEPTION
+                                WHEN OTHERS THEN
+                                    DBMS_OUTPUT.PUT_LINE('SWAP: FAILED - ' || SQLERRM);
+                                    v_result := FALSE;
+                                    IF v_renamed THEN
+                                        -- Undo step 1 so the original table keeps its name
+                                        EXECUTE IMMEDIATE 'ALTER TABLE ' || v_owner || '.' || v_old_table || ' RENAME TO ' || v_table;
+                                        DBMS_OUTPUT.PUT_LINE('  Rolled back: ' || v_old_table || ' restored to ' || v_table);
+                                    END IF;
+                            END;
+
+                            IF v_result THEN
+                                SELECT COUNT(*) INTO v_count FROM all_tables
+                                WHERE owner = v_owner AND table_name IN (v_table, v_old_table);
+                                IF v_count = 2 THEN
+                                    DBMS_OUTPUT.PUT_LINE('POST_SWAP: PASSED');
+                                    DBMS_OUTPUT.PUT_LINE('RESULT: PASSED - Swap and validation complete');
+                                ELSE
+                                    DBMS_OUTPUT.PUT_LINE('POST_SWAP: FAILED');
+                                    DBMS_OUTPUT.PUT_LINE('RESULT: FAILED - Unexpected table state after swap');
+                                    v_result := FALSE;
+                                END IF;
+                            ELSE
+                                DBMS_OUTPUT.PUT_LINE('RESULT: FAILED - Swap failed');
+                            END IF;
+                        END IF;
+                    END;
+
                 ELSE
                     DBMS_OUTPUT.PUT_LINE('ERROR: Unknown WORKFLOW operation');
-                    DBMS_OUTPUT.PUT_LINE('Valid: pre_swap, post_swap, post_create, create_renamed_view, finalize_swap, add_hash_subpartitions');
+                    DBMS_OUTPUT.PUT_LINE('Valid: pre_swap, post_swap, swap_full, post_create, create_renamed_view, finalize_swap, add_hash_subpartitions');
                     v_result := FALSE;
             END CASE;
 
@@ -1359,7 +1424,7 @@ BEGIN
             END CASE;
 
         ELSE
-            DBMS_OUTPUT.PUT_LINE('ERROR: Unknown category: ' || v_category);
+            DBMS_OUTPUT.PUT_LINE('ERROR: Unknown category: ' || UPPER('&category'));
             DBMS_OUTPUT.PUT_LINE('Valid categories: READONLY, WRITE, WORKFLOW, CLEANUP, SYS');
             v_result := FALSE;
     END CASE;
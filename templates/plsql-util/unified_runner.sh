@@ -108,7 +108,7 @@ execute_validation() {
 	enable_constraints | disable_constraints)
 		CATEGORY="WRITE"
 		;;
-	pre_swap | post_swap | post_data_load | post_create | create_renamed_view | finalize_swap | pre_create_partitions | add_hash_subpartitions)
+	pre_swap | post_swap | swap_full | post_data_load | post_create | create_renamed_view | finalize_swap | pre_create_partitions | add_hash_subpartitions)
 		CATEGORY="WORKFLOW"
 		;;
 	drop | rename)
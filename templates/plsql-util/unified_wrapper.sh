@@ -69,6 +69,7 @@ ${GREEN}COMMANDS:${NC}
     Operations:
       • pre_swap <owner> <table> <new> <old> - Pre-swap validation
       • post_swap <owner> <table> <old> - Post-swap validation
+      • swap_full <owner> <table> <new> <old> - Pre-checks, swap and post-checks in one call
       • post_data_load <owner> <table> <source> <source_count> [parallel] - Post-load validation
       • post_create <owner> <table> [parallel] - Post-create validation and stats
       • create_renamed_view <owner> <table> - Create view with INSTEAD OF trigger (SECURE)
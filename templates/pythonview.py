@@ -1,81 +1,143 @@
 #!/usr/bin/env python3
 """Convert migration_config.json to Excel format"""
-import json
-import pandas as pd
+import sys
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from lib.json_loader import load_file  # noqa: E402
+
+# xlsxwriter streams rows in constant memory; without it the workbook is
+# built with pandas/openpyxl instead
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+SUMMARY_HEADERS = [
+    'Schema', 'Generated Date', 'Total Tables', 'Tables Selected', 'Environment'
+]
+TABLE_HEADERS = [
+    'Owner', 'Table Name', 'Enabled', 'Partition Type', 'Size (GB)',
+    'Row Count', 'Column Count', 'Index Count', 'LOB Count', 'Migration Action'
+]
+COLUMN_HEADERS = [
+    'Table', 'Column Name', 'Type', 'Length', 'Precision', 'Scale', 'Nullable'
+]
+
+def _table_rows(tables):
+    """Yield one Tables sheet row per table"""
+    for table in tables:
+        current = table.get('current_state', {})
+        action = table.get('migration_action', {}).get('action', '')
+        
+        yield [
+            table.get('owner', ''),
+            table.get('table_name', ''),
+            table.get('enabled', False),
+            current.get('partition_type', 'N/A'),
+            current.get('size_gb', 0),
+            current.get('row_count', 0),
+            len(current.get('columns', [])),
+            current.get('index_count', 0),
+            current.get('lob_count', 0),
+            action
+        ]
+
+def _column_rows(tables):
+    """Yield Columns sheet rows for each enabled table
+    
+    Only key column info is included (identity details omitted for space).
+    """
+    for table in tables:
+        if table.get('enabled'):
+            table_name = table.get('table_name', '')
+            for col in table.get('current_state', {}).get('columns', ()):
+                if not col.get('is_identity'):
+                    yield [
+                        table_name,
+                        col.get('name', ''),
+                        col.get('type', ''),
+                        col.get('length', ''),
+                        col.get('precision', ''),
+                        col.get('scale', ''),
+                        col.get('nullable', '')
+                    ]
+
+def _write_streaming(excel_file, sheets):
+    """Stream sheets into an xlsxwriter workbook, returning row counts
+    
+    constant_memory flushes each row once the next one starts, so only one
+    row is held in memory. The Columns sheet is only added when non-empty.
+    """
+    workbook = xlsxwriter.Workbook(
+        excel_file, {'constant_memory': True, 'strings_to_numbers': False}
+    )
+    header = workbook.add_format({'bold': True})
+    counts = {}
+    for name, headers, rows in sheets:
+        sheet = None
+        count = 0
+        for row in rows:
+            if sheet is None:
+                sheet = workbook.add_worksheet(name)
+                sheet.write_row(0, 0, headers, header)
+            count += 1
+            sheet.write_row(count, 0, row)
+        if sheet is None and name != 'Columns':
+            workbook.add_worksheet(name).write_row(0, 0, headers, header)
+        counts[name] = count
+    workbook.close()
+    return counts
+
+def _write_pandas(excel_file, sheets):
+    """Write sheets with pandas/openpyxl when xlsxwriter is not installed"""
+    import pandas as pd
+    
+    counts = {}
+    with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
+        for name, headers, rows in sheets:
+            frame = pd.DataFrame(list(rows), columns=headers)
+            if len(frame) or name != 'Columns':
+                frame.to_excel(writer, sheet_name=name, index=False)
+            counts[name] = len(frame)
+    return counts
+
 def json_to_excel(json_file='migration_config.json', excel_file=None):
     if excel_file is None:
         excel_file = json_file.replace('.json', '.xlsx')
     
     print(f"📖 Reading {json_file}...")
-    with open(json_file, 'r') as f:
-        config = json.load(f)
+    config = load_file(json_file)
     
     metadata = config.get('metadata', {})
     tables = config.get('tables', [])
     
     print(f"📊 Processing {len(tables)} tables...")
     
-    # Create Excel writer
-    with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
-        # Sheet 1: Summary
-        summary_data = {
-            'Schema': [metadata.get('source_schema', '')],
-            'Generated Date': [metadata.get('generated_date', '')],
-            'Total Tables': [len(tables)],
-            'Tables Selected': [metadata.get('tables_selected_for_migration', 0)],
-            'Environment': [config.get('environment_config', {}).get('name', '')]
-        }
-        pd.DataFrame(summary_data).to_excel(writer, sheet_name='Summary', index=False)
-        
-        # Sheet 2: Tables Overview
-        tables_data = []
-        for table in tables:
-            current = table.get('current_state', {})
-            action = table.get('migration_action', {}).get('action', '')
-            
-            tables_data.append({
-                'Owner': table.get('owner', ''),
-                'Table Name': table.get('table_name', ''),
-                'Enabled': table.get('enabled', False),
-                'Partition Type': current.get('partition_type', 'N/A'),
-                'Size (GB)': current.get('size_gb', 0),
-                'Row Count': current.get('row_count', 0),
-                'Column Count': len(current.get('columns', [])),
-                'Index Count': current.get('index_count', 0),
-                'LOB Count': current.get('lob_count', 0),
-                'Migration Action': action
-            })
-        
-        pd.DataFrame(tables_data).to_excel(writer, sheet_name='Tables', index=False)
-        
-        # Sheet 3: Columns (for each enabled table)
-        columns_data = []
-        for table in tables:
-            if table.get('enabled'):
-                table_name = table.get('table_name', '')
-                for col in table.get('current_state', {}).get('columns', []):
-                    # Only include key column info (omit identity details for space)
-                    if not col.get('is_identity'):
-                        columns_data.append({
-                            'Table': table_name,
-                            'Column Name': col.get('name', ''),
-                            'Type': col.get('type', ''),
-                            'Length': col.get('length', ''),
-                            'Precision': col.get('precision', ''),
-                            'Scale': col.get('scale', ''),
-                            'Nullable': col.get('nullable', '')
-                        })
-        
-        if columns_data:
-            pd.DataFrame(columns_data).to_excel(writer, sheet_name='Columns', index=False)
+    summary_rows = [[
+        metadata.get('source_schema', ''),
+        metadata.get('generated_date', ''),
+        len(tables),
+        metadata.get('tables_selected_for_migration', 0),
+        config.get('environment_config', {}).get('name', '')
+    ]]
+    sheets = [
+        ('Summary', SUMMARY_HEADERS, summary_rows),
+        ('Tables', TABLE_HEADERS, _table_rows(tables)),
+        ('Columns', COLUMN_HEADERS, _column_rows(tables)),
+    ]
+    
+    if xlsxwriter is not None:
+        counts = _write_streaming(excel_file, sheets)
+    else:
+        counts = _write_pandas(excel_file, sheets)
+    table_count, column_count = counts['Tables'], counts['Columns']
     
     print(f"✅ Created {excel_file}")
     print(f"   - Summary sheet")
-    print(f"   - Tables overview ({len(tables_data)} tables)")
-    print(f"   - Columns details ({len(columns_data)} columns)")
+    print(f"   - Tables overview ({table_count} tables)")
+    print(f"   - Columns details ({column_count} columns)")
 
 if __name__ == '__main__':
     json_to_excel()
\ No newline at end of file
@@ -21,7 +21,7 @@ pip install --upgrade pip
 if [ -f requirements.txt ]; then
     pip install -r requirements.txt
 else
-    pip install oracledb jinja2 jsonschema pytest black pylint
+    pip install oracledb jinja2 jsonschema xlsxwriter pytest black pylint
 fi
 
 echo ""